@@ -1,6 +1,11 @@
 # app/crud.py
-from typing import List, Optional
-from sqlalchemy.sql import select, insert, update, delete
+import functools
+from typing import AsyncIterator, Dict, FrozenSet, Iterable, List, Optional
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql import select, insert, update, delete, bindparam, literal_column, text
+from sqlalchemy.sql.elements import TextClause
 
 from . import database
 from . import entities
@@ -9,12 +14,55 @@ from . import mappers
 
 ## ====================================================
 
-async def _get_person_entity(person_id: int) -> Optional[entities.PersonEntity]:
-    """Internal helper to fetch a person by ID and map to PersonEntity."""
-    query = select(entities.people).where(entities.people.c.id == person_id)
+# Validates a whole page of database rows into response models in one call.
+# Rows are read through PersonResponse's from_attributes config rather than copied into dicts
+# (a databases Record's _mapping is a positional Row, which pydantic cannot read by key).
+_PEOPLE_ADAPTER = TypeAdapter(List[models.PersonResponse])
+
+# Statements for the CRUD hot path are compiled once to SQL text with :named binds, so each call
+# only binds its values (.bindparams()) instead of cloning and recompiling a Core construct
+_SQL_TEXT_DIALECT = sqlite.dialect(paramstyle="named")
+
+def _compiled_text(statement) -> TextClause:
+    """Compiles a Core statement to SQL text once, keeping its bind names."""
+    return text(str(statement.compile(dialect=_SQL_TEXT_DIALECT)))
+
+_SELECT_PERSON_BY_ID = _compiled_text(
+    select(entities.people).where(entities.people.c.id == bindparam("person_id"))
+)
+_SELECT_PEOPLE_PAGE = _compiled_text(
+    select(entities.people)
+    .order_by(entities.people.c.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+# Keyset page: seeks straight past the last seen ID instead of scanning and discarding OFFSET rows
+_SELECT_PEOPLE_AFTER_ID = _compiled_text(
+    select(entities.people)
+    .where(entities.people.c.id > bindparam("after_id"))
+    .order_by(entities.people.c.id)
+    .limit(bindparam("limit"))
+    .offset(literal_column("0"))  # SQLite renders a bound LIMIT with an OFFSET; keep it literal, not an unnamed bind
+)
+_INSERT_PERSON = insert(entities.people)
+_DELETE_PERSON = _compiled_text(
+    delete(entities.people)
+    .where(entities.people.c.id == bindparam("person_id"))
+    .returning(entities.people.c.id)
+)
+
+# Short-lived cache of recently read people keyed by ID, invalidated on every write.
+# Entries are plain dicts so callers never share a mutable model instance.
+_PERSON_CACHE = TTLCache(maxsize=4096, ttl=1.0)
+
+## ====================================================
+
+async def _get_person_response(person_id: int) -> Optional[models.PersonResponse]:
+    """Internal helper to fetch a person by ID and map the row straight to a PersonResponse."""
+    query = _SELECT_PERSON_BY_ID.bindparams(person_id=person_id)
     db_row = await database.database.fetch_one(query)
     if db_row:
-        return mappers.to_person_entity_from_dict(db_row)
+        return models.PersonResponse.model_validate(db_row)
     return None
 
 ## ====================================================
@@ -29,20 +77,48 @@ async def create_person(person_data: models.PersonCreateRequest) -> models.Perso
     Returns:
         models.PersonResponse: The created person data, including its database ID, as an API response model.
     """
-    insert_query = insert(entities.people).values(
-        first_name=person_data.first_name,
-        last_name=person_data.last_name,
-        age=person_data.age,
-        email=person_data.email
-    )
-    last_record_id = await database.database.execute(insert_query)
+    insert_values = {
+        "first_name": person_data.first_name,
+        "last_name": person_data.last_name,
+        "age": person_data.age,
+        "email": person_data.email,
+    }
+    last_record_id = await database.database.execute(_INSERT_PERSON, insert_values)
     
-    # Fetch the newly created record to get all its data for the response
-    created_person_entity = await _get_person_entity(last_record_id)
-    if not created_person_entity: # Should ideally not happen if insert was successful
-        raise Exception(f"Failed to retrieve person with id {last_record_id} after creation.")
-    
-    return mappers.to_person_response_from_entity(created_person_entity)
+    _PERSON_CACHE.pop(last_record_id, None)
+
+    # The request already holds every (validated) column value, so build the response from it
+    # and the new row id instead of reading the row back from the database.
+    return models.PersonResponse.model_construct(id=last_record_id, **insert_values)
+
+## ====================================================
+
+# SQLite caps bound parameters per statement at 999 on older builds; each person row binds 4
+_BULK_INSERT_CHUNK_SIZE = 999 // 4
+
+async def create_people_bulk(people_data: List[models.PersonCreateRequest]) -> List[models.PersonResponse]:
+    """
+    Creates many people at once using multi-row INSERT statements inside a single transaction.
+
+    Args:
+        people_data (List[models.PersonCreateRequest]): The people to create, from the API request.
+
+    Returns:
+        List[models.PersonResponse]: The created people, including their database IDs, in request order.
+    """
+    rows = [person.model_dump() for person in people_data]
+    created_rows = []
+    async with database.database.transaction():
+        for start in range(0, len(rows), _BULK_INSERT_CHUNK_SIZE):
+            chunk = rows[start:start + _BULK_INSERT_CHUNK_SIZE]
+            insert_query = insert(entities.people).values(chunk).returning(*entities.people.c)
+            created_rows.extend(await database.database.fetch_all(insert_query))
+    # SQLite doesn't guarantee the order of RETURNING rows. Within one transaction the new rowids are
+    # handed out in insert order, though, so sorting by ID restores request order.
+    created_rows.sort(key=lambda created_row: created_row["id"])
+    for created_row in created_rows:
+        _PERSON_CACHE.pop(created_row["id"], None)
+    return _PEOPLE_ADAPTER.validate_python(created_rows)
 
 ## ====================================================
 
@@ -56,32 +132,97 @@ async def get_person(person_id: int) -> Optional[models.PersonResponse]:
     Returns:
         Optional[models.PersonResponse]: The person API model if found, otherwise None.
     """
-    person_entity = await _get_person_entity(person_id)
-    if person_entity:
-        return mappers.to_person_response_from_entity(person_entity)
-    return None
+    cached_person = _PERSON_CACHE.get(person_id)
+    if cached_person is not None:
+        return models.PersonResponse.model_construct(**cached_person)
+
+    person_response = await _get_person_response(person_id)
+    if person_response:
+        _PERSON_CACHE[person_id] = person_response.model_dump()
+    return person_response
 
 ## ====================================================
 
-async def get_people(skip: int = 0, limit: int = 100) -> List[models.PersonResponse]:
+# SQLite caps bound parameters per statement at 999 on older builds; each ID binds 1
+_IN_LIST_CHUNK_SIZE = 999
+
+async def get_people_by_ids(person_ids: Iterable[int]) -> Dict[int, models.PersonResponse]:
     """
-    Retrieves a list of people, with optional pagination, as API response models.
+    Retrieves several people by ID with one IN query per chunk of up to 999 IDs.
 
     Args:
-        skip (int): Number of records to skip for pagination.
+        person_ids (Iterable[int]): The IDs of the people to retrieve. Duplicates are ignored.
+
+    Returns:
+        Dict[int, models.PersonResponse]: The found people keyed by ID; missing IDs are simply absent.
+    """
+    unique_ids = list(dict.fromkeys(person_ids))
+    db_results = []
+    # Long ID lists are split so no IN (...) binds more parameters than SQLite allows.
+    # Built per call: databases renders IN lists at compile time, so an expanding bind can't be reused
+    for start in range(0, len(unique_ids), _IN_LIST_CHUNK_SIZE):
+        chunk = unique_ids[start:start + _IN_LIST_CHUNK_SIZE]
+        query = select(entities.people).where(entities.people.c.id.in_(chunk))
+        db_results.extend(await database.database.fetch_all(query))
+    return {person.id: person for person in _PEOPLE_ADAPTER.validate_python(db_results)}
+
+## ====================================================
+
+async def get_people(skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[models.PersonResponse]:
+    """
+    Retrieves a list of people ordered by ID, with optional pagination, as API response models.
+
+    Args:
+        skip (int): Number of records to skip for pagination. Ignored when after_id is given.
         limit (int): Maximum number of records to return.
+        after_id (Optional[int]): Keyset cursor; when set, returns people with an ID greater than this one.
 
     Returns:
         List[models.PersonResponse]: A list of person API models.
     """
-    query = select(entities.people).offset(skip).limit(limit)
+    if after_id is not None:
+        query = _SELECT_PEOPLE_AFTER_ID.bindparams(after_id=after_id, limit=limit)
+    else:
+        query = _SELECT_PEOPLE_PAGE.bindparams(skip=skip, limit=limit)
     db_results = await database.database.fetch_all(query)
     
-    response_list: List[models.PersonResponse] = []
-    for db_row in db_results:
-        entity = mappers.to_person_entity_from_dict(db_row)
-        response_list.append(mappers.to_person_response_from_entity(entity))
-    return response_list
+    return _PEOPLE_ADAPTER.validate_python(db_results)
+
+## ====================================================
+
+async def iter_people(skip: int = 0, limit: int = 100) -> AsyncIterator[models.PersonResponse]:
+    """
+    Streams people ordered by ID, one API response model at a time.
+
+    Unlike get_people, rows are never collected into a list, so memory stays flat regardless of limit.
+
+    Args:
+        skip (int): Number of records to skip for pagination.
+        limit (int): Maximum number of records to return.
+
+    Yields:
+        models.PersonResponse: Each person API model in turn.
+    """
+    query = _SELECT_PEOPLE_PAGE.bindparams(skip=skip, limit=limit)
+    async for db_row in database.database.iterate(query):
+        yield models.PersonResponse.model_validate(db_row)
+
+## ====================================================
+
+@functools.lru_cache(maxsize=32)
+def _update_person_statement(columns: FrozenSet[str]) -> TextClause:
+    """
+    Builds the UPDATE ... RETURNING statement for one set of updated columns.
+
+    There are only 15 possible column sets, so each is compiled once and reused;
+    like the other hot-path statements it is cached as SQL text whose binds are filled in per call.
+    """
+    return _compiled_text(
+        update(entities.people)
+        .where(entities.people.c.id == bindparam("person_id"))
+        .values({column: bindparam(f"new_{column}") for column in sorted(columns)})
+        .returning(*entities.people.c)
+    )
 
 ## ====================================================
 
@@ -96,26 +237,21 @@ async def update_person(person_id: int, person_update_data: models.PersonUpdateR
     Returns:
         Optional[models.PersonResponse]: The updated person API model if found and updated, otherwise None.
     """
-    existing_entity = await _get_person_entity(person_id)
-    if not existing_entity:
-        return None # Person not found
-
     update_values = mappers.to_update_dict_from_request(person_update_data)
     if not update_values: # No actual data provided for update
-        return mappers.to_person_response_from_entity(existing_entity) # Return current state
+        return await get_person(person_id) # Return current state, or None if not found
 
-    update_query = (
-        update(entities.people)
-        .where(entities.people.c.id == person_id)
-        .values(**update_values)
+    # UPDATE ... RETURNING applies the change and hands back the row in one statement
+    update_query = _update_person_statement(frozenset(update_values)).bindparams(
+        person_id=person_id,
+        **{f"new_{column}": value for column, value in update_values.items()},
     )
-    await database.database.execute(update_query)
-    
-    updated_person_entity = await _get_person_entity(person_id)
-    if not updated_person_entity: # Should not happen if update was on existing ID
-        return None
-        
-    return mappers.to_person_response_from_entity(updated_person_entity)
+    db_row = await database.database.fetch_one(update_query)
+    _PERSON_CACHE.pop(person_id, None)
+    if not db_row:
+        return None # Person not found
+
+    return models.PersonResponse.model_validate(db_row)
 
 ## ====================================================
 
@@ -129,10 +265,7 @@ async def delete_person(person_id: int) -> bool:
     Returns:
         bool: True if deleted, False if not found.
     """
-    existing_entity = await _get_person_entity(person_id)
-    if not existing_entity:
-        return False
-        
-    delete_query = delete(entities.people).where(entities.people.c.id == person_id)
-    await database.database.execute(delete_query)
-    return True
+    delete_query = _DELETE_PERSON.bindparams(person_id=person_id)
+    deleted_row = await database.database.fetch_one(delete_query)
+    _PERSON_CACHE.pop(person_id, None)
+    return deleted_row is not None
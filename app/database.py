@@ -1,32 +1,99 @@
 import os
 import asyncio
+import sqlite3
+from typing import Optional, Tuple
 
 import sqlalchemy
 import databases
 
 ## ====================================================
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./people.db")
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./people.db"
+
+def database_url_from_env() -> str:
+    """Returns the configured database URL, from the DATABASE_URL environment variable or the default."""
+    return os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+
+def sync_database_url_for(url: str) -> str:
+    """
+    Returns the synchronous driver URL for a database URL.
+    For metadata.create_all(), we need a synchronous engine; an aiosqlite URL maps to plain sqlite for DDL.
+    """
+    if url.startswith("sqlite+aiosqlite"):
+        return url.replace("sqlite+aiosqlite", "sqlite", 1)
+    return url
+
+# WAL lets readers run alongside the writer. It is stored in the database file,
+# so connect_db only has to set it once.
+SQLITE_PERSISTENT_PRAGMAS = (
+    "journal_mode=WAL",
+)
+
+# These only last as long as the connection that sets them, and databases opens a fresh
+# aiosqlite connection per task, so every connection applies them as it opens (see
+# _SQLitePragmaConnection). They trade a little durability for far fewer fsyncs and a larger page cache.
+SQLITE_CONNECTION_PRAGMAS = (
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+    "foreign_keys=ON",
+)
+
+class _SQLitePragmaConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that applies SQLITE_CONNECTION_PRAGMAS when it opens.
+    aiosqlite passes the factory through to sqlite3.connect, so this runs on aiosqlite's own thread.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for pragma in SQLITE_CONNECTION_PRAGMAS:
+            self.execute(f"PRAGMA {pragma}")
+
+def make_database(url: str, **database_options) -> Tuple[databases.Database, sqlalchemy.engine.Engine]:
+    """
+    Builds the async database and the synchronous DDL engine for a URL.
+    The module-level objects below are built with this; tests can call it directly for other URLs.
+    Extra keyword arguments (e.g. force_rollback) are passed on to databases.Database.
+    """
+    # An explicit QueuePool keeps DDL connections warm and checks them before reuse.
+    # DDL runs in asyncio.to_thread, so a pooled SQLite connection may be reused from another thread.
+    sync_url = sync_database_url_for(url)
+    sync_engine = sqlalchemy.create_engine(
+        sync_url,
+        connect_args={"check_same_thread": False} if sync_url.startswith("sqlite") else {},
+        poolclass=sqlalchemy.pool.QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=1800,
+    )
+    if sync_url.startswith("sqlite"):
+        database_options.setdefault("factory", _SQLitePragmaConnection)
+    return databases.Database(url, **database_options), sync_engine
+
+DATABASE_URL = database_url_from_env()
+sync_database_url = sync_database_url_for(DATABASE_URL)
 
 # SQLAlchemy specific parts
-database = databases.Database(DATABASE_URL)
+database, engine = make_database(DATABASE_URL)
 metadata = sqlalchemy.MetaData()
 
-# Database engine (used for table creation)
-# For metadata.create_all(), we need a synchronous engine.
-# If the main DATABASE_URL is for aiosqlite, create a sync version for DDL.
-sync_database_url = DATABASE_URL
-if DATABASE_URL.startswith("sqlite+aiosqlite"):
-    sync_database_url = DATABASE_URL.replace("sqlite+aiosqlite", "sqlite", 1)
-engine = sqlalchemy.create_engine(sync_database_url)
-
 ## ====================================================
 
-async def connect_db():
+async def connect_db(db: Optional[databases.Database] = None, db_engine: Optional[sqlalchemy.engine.Engine] = None):
     """
     Connect to the database and create tables if they don't exist.
+    Uses the module's database and engine unless others are given (e.g. from make_database).
     """
-    await database.connect()
+    db = database if db is None else db
+    db_engine = engine if db_engine is None else db_engine
+    is_sqlite = db.url.dialect == "sqlite"
+
+    await db.connect()
+    if is_sqlite:
+        for pragma in SQLITE_PERSISTENT_PRAGMAS:
+            await db.execute(f"PRAGMA {pragma}")
     # Create tables if they don't exist (moved here from main.py startup)
     # This ensures tables are created when the DB connection is established.
     # Note: For more complex migrations, consider tools like Alembic.
@@ -34,16 +101,31 @@ async def connect_db():
     # Run synchronous DDL in a thread to avoid blocking the event loop
     # and to ensure compatibility with SQLAlchemy's sync engine + aiosqlite.
     def _create_tables_sync():
-        with engine.connect() as connection:
+        with db_engine.connect() as connection:
             metadata.create_all(bind=connection)
             connection.commit() # Ensure DDL is committed
     
+    # On warm starts the schema already exists, so a cheap async lookup in sqlite_master
+    # lets us skip the thread hop and the extra sync connection entirely.
+    if is_sqlite and await _sqlite_tables_exist(db):
+        return
+
     await asyncio.to_thread(_create_tables_sync)
 
 ## ====================================================
 
-async def disconnect_db():
+async def _sqlite_tables_exist(db: databases.Database) -> bool:
+    """
+    Check whether every table in the metadata is already present in the SQLite database.
+    """
+    rows = await db.fetch_all("SELECT name FROM sqlite_master WHERE type='table'")
+    existing_tables = {row["name"] for row in rows}
+    return set(metadata.tables).issubset(existing_tables)
+
+## ====================================================
+
+async def disconnect_db(db: Optional[databases.Database] = None):
     """
     Disconnect from the database.
     """
-    await database.disconnect()
+    await (database if db is None else db).disconnect()
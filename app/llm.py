@@ -1,54 +1,238 @@
 # app/llm.py
+import asyncio
+import contextlib
 import os
-from openai import OpenAI
+import functools
+import logging
+from typing import AsyncIterator
+
+import httpx
+from openai import AsyncOpenAI, RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 from semantic_kernel import Kernel
 from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion
 
 # Import plugins
-from .plugins.people_crud_plugin import PeopleCRUDPlugin
+from .plugins.people_crud_plugin import people_crud_plugin
 from .plugins.system_prompt_plugin import SystemPromptPlugin
 
 ## ====================================================
 
-# Initialize OpenAI client and Semantic Kernel
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-kernel = Kernel()
-kernel.add_service(
-    OpenAIChatCompletion(
-        service_id="chat-gpt",
-        ai_model_id=os.getenv("OPENAI_API_MODEL", "gpt-4o-mini"),
-        api_key=os.getenv("OPENAI_API_KEY"),
+logger = logging.getLogger(__name__)
+
+# Chat model used for every completion, resolved once at import
+OPENAI_MODEL = os.getenv("OPENAI_API_MODEL", "gpt-4o-mini")
+
+# Static system message shared by every get_llm_response call
+_SYSTEM_MSG = {"role": "system", "content": "You are a helpful assistant."}
+
+## ====================================================
+
+# The OpenAI client and Semantic Kernel are built lazily on first use, so importing this
+# module (e.g. from tests, or in every pre-forked worker) doesn't pay for plugin registration.
+
+@functools.cache
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Returns the shared OpenAI client, creating it on first use.
+    One HTTP/2 connection pool is shared, so TCP/TLS setup is paid once rather than per request.
+    """
+    http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=httpx.Timeout(60.0),
     )
+    # Rate limits are retried by create_chat_completion below, so the SDK's own retries are turned off
+    return AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=http_client, max_retries=0)
+
+## ====================================================
+
+# Caps in-flight completion requests so a traffic spike queues here instead of exhausting the connection pool;
+# the default matches the pool's keep-alive size
+_OPENAI_CONCURRENCY = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "100")))
+
+_BACKOFF = wait_exponential_jitter(initial=1, max=30)
+
+def _rate_limit_wait(retry_state) -> float:
+    """Waits as long as the server's Retry-After header asks, else backs off exponentially with jitter."""
+    error = retry_state.outcome.exception()
+    retry_after = getattr(getattr(error, "response", None), "headers", {}).get("retry-after")
+    try:
+        return min(float(retry_after), 60.0)
+    except (TypeError, ValueError):
+        return _BACKOFF(retry_state)
+
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=_rate_limit_wait,
+    stop=stop_after_attempt(5),
+    reraise=True,
 )
+async def create_chat_completion(**kwargs):
+    """
+    Creates a chat completion on the shared client, retrying 429 rate-limit errors with backoff
+    so a burst doesn't turn straight into failed requests. Backoff waits don't hold a concurrency slot.
+    """
+    async with _OPENAI_CONCURRENCY:
+        return await get_openai_client().chat.completions.create(**kwargs)
+
+@retry(
+    retry=retry_if_exception_type(RateLimitError),
+    wait=_rate_limit_wait,
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+async def _open_chat_completion_stream(**kwargs):
+    """
+    Opens a streaming chat completion, retrying rate limits like create_chat_completion.
+    On success the caller owns the acquired concurrency slot and must release it.
+    """
+    await _OPENAI_CONCURRENCY.acquire()
+    try:
+        return await get_openai_client().chat.completions.create(stream=True, **kwargs)
+    except BaseException:
+        _OPENAI_CONCURRENCY.release()
+        raise
+
+@contextlib.asynccontextmanager
+async def stream_chat_completion(**kwargs) -> AsyncIterator:
+    """
+    Opens a streaming chat completion on the shared client and yields the chunk stream.
+    create() returns once the response headers arrive, but the connection stays busy until the last
+    chunk is read, so the concurrency slot is held until the stream is exhausted or the block exits.
+    """
+    stream = await _open_chat_completion_stream(**kwargs)
+    try:
+        yield stream
+    finally:
+        try:
+            await stream.close()
+        finally:
+            _OPENAI_CONCURRENCY.release()
 
 ## ====================================================
 
-# Load plugins into the kernel
-kernel.add_plugin(PeopleCRUDPlugin(), plugin_name="PeopleCRUD")
-kernel.add_plugin(SystemPromptPlugin(), plugin_name="SystemPrompt")
+@functools.cache
+def get_kernel() -> Kernel:
+    """
+    Returns the shared Semantic Kernel with the chat service and plugins loaded, creating it on first use.
+    """
+    kernel = Kernel()
+    kernel.add_service(
+        OpenAIChatCompletion(
+            service_id="chat-gpt",
+            ai_model_id=OPENAI_MODEL,
+            async_client=get_openai_client(),
+        )
+    )
+
+    # Load plugins into the kernel
+    kernel.add_plugin(people_crud_plugin, plugin_name="PeopleCRUD")
+    kernel.add_plugin(SystemPromptPlugin(), plugin_name="SystemPrompt")
+    return kernel
 
 ## ====================================================
 
+@functools.cache
+def get_people_crud_tools() -> list:
+    """
+    Returns the OpenAI tool definitions for the PeopleCRUD plugin, building them on first use.
+    The kernel and its plugins are process-wide singletons, so the schema never changes afterwards.
+    Raises KeyError if the PeopleCRUD plugin isn't loaded.
+    """
+    tools = []
+    plugin = get_kernel().plugins["PeopleCRUD"]
+
+    # Convert plugin functions to OpenAI tool format
+    for func_name, func_metadata in plugin.functions.items():
+        # Extract parameters for the function
+        parameters = {
+            "type": "object",
+            "properties": {}
+        }
+
+        # Handle parameters properly
+        for param in func_metadata.parameters:
+            # Set default type to string if not specified
+            param_type = "string"
+
+            # Add the parameter with proper type and description
+            parameters["properties"][param.name] = {
+                "type": param_type,
+                "description": param.description or f"Parameter {param.name}"
+            }
+
+        # Create the tool definition with proper schema
+        tools.append({
+            "type": "function",
+            "function": {
+                "name": f"{plugin.name}_{func_name}",
+                "description": func_metadata.description or f"Function to {func_name}",
+                "parameters": parameters
+            }
+        })
+
+    return tools
+
+@functools.cache
+def get_tool_function_index() -> dict:
+    """
+    Returns the lookup table from tool names, as built by get_people_crud_tools ("<plugin>_<function>"),
+    to (plugin name, function name, kernel function), built on first use. Every loaded plugin is indexed,
+    and bare PeopleCRUD function names are accepted too, matching how tool names were parsed before.
+    """
+    kernel = get_kernel()
+    index = {}
+    for plugin_name, plugin in kernel.plugins.items():
+        for func_name, kernel_function in plugin.functions.items():
+            index[f"{plugin_name}_{func_name}"] = (plugin_name, func_name, kernel_function)
+    if "PeopleCRUD" in kernel.plugins:
+        for func_name, kernel_function in kernel.plugins["PeopleCRUD"].functions.items():
+            index.setdefault(func_name, ("PeopleCRUD", func_name, kernel_function))
+    return index
+
+## ====================================================
+
+def warm_up_llm():
+    """
+    Builds the kernel, the PeopleCRUD tool schema and the tool-name index at startup, so the first chat request doesn't pay for it.
+    A failure (e.g. no OPENAI_API_KEY, or a missing plugin) is logged at startup and retried on first use,
+    so the People API still starts without LLM configuration.
+    """
+    try:
+        get_people_crud_tools()
+        get_tool_function_index()
+    except Exception:
+        logger.warning("LLM warm-up failed; the kernel will be built on first use", exc_info=True)
+
+
 async def get_llm_response(prompt: str) -> str:
     """
     Placeholder function to get a response from an LLM (e.g., OpenAI).
     """
     try:
-        response = client.chat.completions.create(
-            model=os.getenv("OPENAI_API_MODEL", "gpt-4o-mini"), # Use model from .env, fallback to gpt-4o-mini
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": prompt}
-            ]
+        response = await create_chat_completion(
+            model=OPENAI_MODEL, # Model from .env, fallback to gpt-4o-mini
+            messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}]
         )
         return response.choices[0].message.content
     except Exception as e:
-        print(f"Error getting LLM response: {e}")
+        logger.exception("Error getting LLM response")
         # Consider raising an HTTPException here for API responses
         return f"Error: Could not get response from LLM. Details: {str(e)}"
 
 ## ====================================================
 
+async def close_llm_client():
+    """
+    Close the shared OpenAI HTTP connection pool, if it was ever opened.
+    """
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+
+## ====================================================
+
 async def process_with_llm_tool(tool_name: str, tool_input: dict) -> dict:
     """
     Placeholder function to simulate an LLM deciding to use a tool
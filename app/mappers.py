@@ -18,14 +18,20 @@ def to_person_entity_from_create(request_model: models.PersonCreateRequest, gene
 ## ====================================================
 
 def to_person_entity_from_dict(data: Union[Dict[str, Any], Mapping]) -> entities.PersonEntity:
-    """Maps a dictionary (e.g., a database row) to a PersonEntity."""
-    return entities.PersonEntity(**data)
+    """Maps a dictionary (e.g., a database row) to a PersonEntity.
+
+    Database rows are trusted, so validation is skipped via model_construct.
+    """
+    return entities.PersonEntity.model_construct(**dict(data))
 
 ## ====================================================
 
 def to_person_response_from_entity(entity: entities.PersonEntity) -> models.PersonResponse:
-    """Maps a PersonEntity database model to a PersonResponse API model."""
-    return models.PersonResponse(
+    """Maps a PersonEntity database model to a PersonResponse API model.
+
+    The entity has already been validated, so the response is built via model_construct.
+    """
+    return models.PersonResponse.model_construct(
         id=entity.id,
         first_name=entity.first_name,
         last_name=entity.last_name,
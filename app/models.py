@@ -1,12 +1,19 @@
 # app/models.py
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
 ## ====================================================
 
+class ChatMessage(BaseModel):
+    role: Literal["system", "user", "assistant", "tool"]
+    content: str = ""
+
 class ChatRequest(BaseModel):
     user_query: str
-    chat_history: list[dict[str, str]] = []
+    chat_history: list[ChatMessage] = []
+
+class BatchChatRequest(BaseModel):
+    requests: List[ChatRequest] = Field(..., min_length=1, max_length=20)
 
 class ExecuteToolRequest(BaseModel):
     plugin_name: str
@@ -51,6 +58,13 @@ class PersonResponse(PersonBaseModel):
 
 ## ====================================================
 
+class PeoplePage(BaseModel):
+    """Model for a cursor-paginated page of people."""
+    items: List[PersonResponse]
+    next_cursor: Optional[int] = Field(None, description="ID to pass as 'cursor' for the next page; null when there are no more")
+
+## ====================================================
+
 class MCPParameter(BaseModel):
     name: str
     description: str
@@ -1,10 +1,17 @@
 # app/plugins/create_person_plugin.py
-import json
+from pydantic import ValidationError
 
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 
 from app import crud
 from app import models
+from .json_utils import dumps
+
+## ====================================================
+
+# Error payloads pre-serialized at import; only the dynamic field is filled in (JSON-encoded) per call
+_ERR_BAD_JSON = '{"error":"Invalid JSON input provided.","details":%s}'
+_ERR_FAILED = '{"error":"Failed to create person.","details":%s}'
 
 ## ====================================================
 
@@ -28,11 +35,15 @@ class CreatePersonFunction:
         Kernel function to create a new person using JSON data.
         """
         try:
-            person_data_dict = json.loads(person_data_json)
-            person_create_request = models.PersonCreateRequest(**person_data_dict)
+            # Parses and validates the JSON in a single pass
+            person_create_request = models.PersonCreateRequest.model_validate_json(person_data_json)
             created_person_response_model = await crud.create_person(person_data=person_create_request)
-            return json.dumps(created_person_response_model.model_dump())
-        except json.JSONDecodeError as e:
-            return json.dumps({"error": "Invalid JSON input provided.", "details": str(e)})
+            return created_person_response_model.model_dump_json(exclude_none=True)
+        except ValidationError as e:
+            # Structured error list straight from pydantic-core, rather than the formatted str(e)
+            errors = e.errors(include_url=False, include_context=False)
+            if any(error["type"] == "json_invalid" for error in errors):
+                return _ERR_BAD_JSON % dumps(errors)
+            return _ERR_FAILED % dumps(errors)
         except Exception as e: 
-            return json.dumps({"error": "Failed to create person.", "details": str(e)})
+            return _ERR_FAILED % dumps(str(e))
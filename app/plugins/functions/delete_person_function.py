@@ -1,9 +1,17 @@
 # app/plugins/delete_person_plugin.py
-import json
 
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 
 from app import crud
+from .json_utils import dumps
+
+## ====================================================
+
+# Error payloads pre-serialized at import; only the dynamic field is filled in (JSON-encoded) per call
+_DELETED = '{"status":"Person deleted successfully.","person_id":%d}'
+_ERR_NOT_FOUND = '{"error":"Person not found, could not delete.","person_id":%d}'
+_ERR_BAD_ID = '{"error":"Invalid person_id format. Must be an integer.","person_id_received":%s}'
+_ERR_FAILED = '{"error":"Failed to delete person.","details":%s}'
 
 ## ====================================================
 
@@ -25,13 +33,13 @@ class DeletePersonFunction:
         Kernel function to delete a person by ID.
         """
         try:
-            pid = int(person_id)
+            pid = person_id if type(person_id) is int else int(person_id)
             deleted_successfully = await crud.delete_person(person_id=pid)
             if deleted_successfully:
-                return json.dumps({"status": "Person deleted successfully.", "person_id": pid})
+                return _DELETED % pid
             else:
-                return json.dumps({"error": "Person not found, could not delete.", "person_id": pid})
+                return _ERR_NOT_FOUND % pid
         except ValueError:
-            return json.dumps({"error": "Invalid person_id format. Must be an integer.", "person_id_received": str(person_id)})
+            return _ERR_BAD_ID % dumps(str(person_id))
         except Exception as e:
-            return json.dumps({"error": "Failed to delete person.", "details": str(e)})
+            return _ERR_FAILED % dumps(str(e))
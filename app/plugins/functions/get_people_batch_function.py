@@ -0,0 +1,53 @@
+# app/plugins/get_people_batch_plugin.py
+from typing import List
+
+from pydantic import TypeAdapter, ValidationError
+
+from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
+
+from app import crud
+from app import models
+from .json_utils import dumps
+
+## ====================================================
+
+# Built once; parses the ID list and dumps the found people without intermediate dicts
+_IDS_ADAPTER = TypeAdapter(List[int])
+_PEOPLE_ADAPTER = TypeAdapter(List[models.PersonResponse])
+
+# Payloads pre-serialized at import; only the dynamic fields are filled in (JSON-encoded) per call
+_RESULT = '{"people":%s,"missing_ids":%s}'
+_ERR_BAD_IDS = '{"error":"Invalid person_ids_json. Must be a JSON array of integers.","details":%s}'
+_ERR_FAILED = '{"error":"Failed to retrieve people.","details":%s}'
+
+## ====================================================
+
+class GetPeopleBatchFunction:
+    """
+    Plugin for retrieving several people by their IDs in one database round trip.
+    """
+
+    async def get_people_batch_async(
+        self,
+        person_ids_json: KernelParameterMetadata(
+            description="A JSON array of the unique IDs of the people to retrieve. Example: '[1, 2, 3]'",
+            name="person_ids_json",
+            is_required=True,
+            type="string"
+        )
+    ) -> str:
+        """
+        Kernel function to retrieve several people by ID.
+        """
+        try:
+            person_ids = list(dict.fromkeys(_IDS_ADAPTER.validate_json(person_ids_json)))
+            people_by_id = await crud.get_people_by_ids(person_ids)
+
+            # Keep the caller's order and report the IDs that weren't found
+            found = [people_by_id[pid] for pid in person_ids if pid in people_by_id]
+            missing_ids = [pid for pid in person_ids if pid not in people_by_id]
+            return _RESULT % (_PEOPLE_ADAPTER.dump_json(found, exclude_none=True).decode(), dumps(missing_ids))
+        except ValidationError as e:
+            return _ERR_BAD_IDS % dumps(e.errors(include_url=False, include_context=False))
+        except Exception as e:
+            return _ERR_FAILED % dumps(str(e))
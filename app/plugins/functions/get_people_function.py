@@ -1,15 +1,56 @@
 # app/plugins/get_people_plugin.py
-import json
+import asyncio
 import logging # Added
+import random
+from typing import List, Optional
 
+from pydantic import TypeAdapter, ValidationError
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 
 from app import crud
+from app import models
+from .json_utils import dumps
 
 logger = logging.getLogger(__name__) # Added
 
 ## ====================================================
 
+class _DebugSamplingFilter(logging.Filter):
+    """Passes only a random sample of DEBUG records; INFO and above always pass."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+# This runs on every list call, so keep 1% of its debug records
+DEBUG_SAMPLE_RATE = 0.01
+logger.addFilter(_DebugSamplingFilter(rate=DEBUG_SAMPLE_RATE))
+
+## ====================================================
+
+# Serializes a whole page of people to JSON in one call
+_PEOPLE_ADAPTER = TypeAdapter(List[models.PersonResponse])
+
+# Pages at least this large are serialized in a worker thread so one big dump doesn't stall the
+# event loop; smaller pages serialize faster than the thread hand-off costs
+_THREADED_DUMP_MIN_ITEMS = 500
+
+# Page envelope; items and next_cursor are filled in already JSON-encoded
+_PAGE = '{"items":%s,"next_cursor":%s}'
+# The last page under cursor pagination is often empty, so that payload is kept whole
+_EMPTY_PAGE = '{"items":[],"next_cursor":null}'
+
+# Error payloads pre-serialized at import; only the details field is filled in (JSON-encoded) per call
+_ERR_BAD_PAGING = '{"error":"Invalid skip or limit format. Must be integers.","details":%s}'
+_ERR_FAILED = '{"error":"Failed to retrieve people.","details":%s}'
+_MAX_ERROR_ITEMS = 5
+_MAX_ERROR_CHARS = 1000
+
+## ====================================================
+
 class GetPeopleFunction:
     """
     Plugin for retrieving a list of people, with optional pagination.
@@ -18,57 +59,57 @@ class GetPeopleFunction:
     async def get_all_people_async(
         self,
         skip: int,  # Now receives a definite integer
-        limit: int  # Now receives a definite integer
-    ) -> list: # Changed return type hint to list
+        limit: int,  # Now receives a definite integer
+        cursor: Optional[int] = None
+    ) -> str:
         """
-        Kernel function to retrieve a list of people.
+        Kernel function to retrieve a page of people as {"items": [...], "next_cursor": id-or-null}.
+        When cursor is given it takes precedence over skip.
         """
-        logger.debug(f"GetPeopleFunction.get_all_people_async called with skip={skip}, limit={limit}")
+        # One level check per call; each debug line below is then just a local bool test
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("GetPeopleFunction.get_all_people_async called with skip=%s, limit=%s, cursor=%s", skip, limit, cursor)
         try:
             # skip and limit are now guaranteed to be integers by the caller (PeopleCRUDPlugin)
             s = skip
             l = limit
-            logger.debug(f"Using skip={s}, limit={l} for CRUD operation")
 
-            people_response_models = await crud.get_people(skip=s, limit=l)
-            logger.debug(f"crud.get_people returned: {type(people_response_models)}")
+            people_response_models = await crud.get_people(skip=s, limit=l, after_id=cursor)
             
             if not isinstance(people_response_models, list):
-                logger.error(f"crud.get_people did not return a list, but: {type(people_response_models)}")
+                logger.error("crud.get_people did not return a list, but: %s", type(people_response_models))
                 # This will be caught by the generic Exception handler below, which is fine.
                 raise TypeError(f"Expected list from crud.get_people, got {type(people_response_models)}")
 
-            dumped_models = [person.model_dump() for person in people_response_models]
-            logger.debug("Successfully model_dumped all person objects.")
-            
-            logger.debug("Returning list of model_dumped objects.")
-            return dumped_models # Changed: return the list directly
+            if not people_response_models:
+                return _EMPTY_PAGE
+
+            # A short page means there is nothing after it
+            next_cursor = people_response_models[-1].id if len(people_response_models) == l else None
+            if len(people_response_models) >= _THREADED_DUMP_MIN_ITEMS:
+                items_json = await asyncio.to_thread(_PEOPLE_ADAPTER.dump_json, people_response_models, exclude_none=True)
+            else:
+                items_json = _PEOPLE_ADAPTER.dump_json(people_response_models, exclude_none=True)
+            people_json = _PAGE % (items_json.decode(), dumps(next_cursor))
+            if debug_enabled:
+                logger.debug("Serialized %d people (%d bytes)", len(people_response_models), len(people_json))
+            return people_json
             
+        except ValidationError as e:
+            # Checked before ValueError (its base class); reports a few structured entries instead of str(e)
+            logger.error("Row validation failed in GetPeopleFunction: %d errors", e.error_count(), exc_info=True)
+            return _ERR_FAILED % dumps(e.errors(include_url=False, include_context=False, include_input=False)[:_MAX_ERROR_ITEMS])
         except ValueError as ve:
-            logger.error(f"ValueError in GetPeopleFunction: {ve}", exc_info=True)
-            # Return a dict, FastAPI will JSON encode it
-            return {"error": "Invalid skip or limit format. Must be integers.", "details": str(ve)}
+            logger.error("ValueError in GetPeopleFunction: %s", ve, exc_info=True)
+            return _ERR_BAD_PAGING % dumps(str(ve)[:_MAX_ERROR_CHARS])
         except Exception as e:
-            logger.error(f"Unhandled exception in GetPeopleFunction.get_all_people_async: {type(e).__name__} - {str(e)}", exc_info=True)
-            
-            error_details = "An unexpected error occurred."
+            logger.error("Unhandled exception in GetPeopleFunction.get_all_people_async: %s - %s", type(e).__name__, e, exc_info=True)
+
             try:
-                error_details = str(e)
-                if not isinstance(error_details, str):
-                    error_details = "Error object could not be converted to string."
+                error_details = str(e)[:_MAX_ERROR_CHARS]
             except Exception as str_e:
-                logger.error(f"Failed to convert original exception to string: {type(str_e).__name__} - {str(str_e)}", exc_info=True)
+                logger.error("Failed to convert original exception to string: %s - %s", type(str_e).__name__, str_e, exc_info=True)
                 error_details = "Failed to get error details due to a secondary error."
 
-            error_payload = {
-                "error": "Failed to retrieve people.",
-                "details": error_details[:1000] # Truncate to be safe
-            }
-            
-            try:
-                # Return a dict, FastAPI will JSON encode it
-                return error_payload
-            except Exception as dump_e: # This inner try-except might be less necessary if error_payload is simple
-                logger.critical(f"CRITICAL: Failed to prepare error payload: {type(dump_e).__name__} - {str(dump_e)}", exc_info=True)
-                # Fallback to a simple dict that FastAPI can serialize
-                return {"error": "Critical error during error reporting. Check server logs."}
+            return _ERR_FAILED % dumps(error_details)
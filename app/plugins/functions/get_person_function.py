@@ -1,9 +1,16 @@
 # app/plugins/get_person_plugin.py
-import json
 
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 
 from app import crud
+from .json_utils import dumps
+
+## ====================================================
+
+# Error payloads pre-serialized at import; only the dynamic field is filled in (JSON-encoded) per call
+_ERR_BAD_ID = '{"error":"Invalid person_id format. Must be an integer.","person_id_received":%s}'
+_ERR_NOT_FOUND = '{"error":"Person not found.","person_id":%d}'
+_ERR_FAILED = '{"error":"Failed to retrieve person.","details":%s}'
 
 ## ====================================================
 
@@ -25,13 +32,14 @@ class GetPersonFunction:
         Kernel function to retrieve a person by ID.
         """
         try:
-            pid = int(person_id) 
+            # Typed kernel calls already pass an int; only strings need converting
+            pid = person_id if type(person_id) is int else int(person_id)
             person_response_model = await crud.get_person(person_id=pid)
             if person_response_model:
-                return json.dumps(person_response_model.model_dump())
+                return person_response_model.model_dump_json(exclude_none=True)
             else:
-                return json.dumps({"error": "Person not found.", "person_id": pid})
+                return _ERR_NOT_FOUND % pid
         except ValueError:
-            return json.dumps({"error": "Invalid person_id format. Must be an integer.", "person_id_received": str(person_id)})
+            return _ERR_BAD_ID % dumps(str(person_id))
         except Exception as e:
-            return json.dumps({"error": "Failed to retrieve person.", "details": str(e)})
+            return _ERR_FAILED % dumps(str(e))
@@ -0,0 +1,19 @@
+# app/plugins/functions/json_utils.py
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+## ====================================================
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson doesn't serialize natively (datetime and UUID are handled by orjson itself)."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+## ====================================================
+
+def dumps(obj: Any) -> str:
+    """Serializes a plugin payload to a JSON string using orjson."""
+    return orjson.dumps(obj, default=_default).decode()
@@ -1,10 +1,24 @@
 # app/plugins/update_person_plugin.py
-import json
+from pydantic import TypeAdapter, ValidationError
 
 from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 
 from app import crud
 from app import models
+from .json_utils import dumps
+
+## ====================================================
+
+# Built once so each call goes straight to pydantic-core's JSON parse + validate
+_UPDATE_ADAPTER = TypeAdapter(models.PersonUpdateRequest)
+
+## ====================================================
+
+# Error payloads pre-serialized at import; only the dynamic field is filled in (JSON-encoded) per call
+_ERR_NOT_FOUND = '{"error":"Person not found or update failed.","person_id":%d}'
+_ERR_BAD_JSON = '{"error":"Invalid JSON input for update data.","details":%s}'
+_ERR_BAD_ID = '{"error":"Invalid person_id format. Must be an integer.","person_id_received":%s}'
+_ERR_FAILED = '{"error":"Failed to update person.","details":%s}'
 
 ## ====================================================
 
@@ -33,19 +47,22 @@ class UpdatePersonFunction:
         Kernel function to update a person using JSON data.
         """
         try:
-            pid = int(person_id)
-            update_data_dict = json.loads(person_update_data_json)
-            person_update_request = models.PersonUpdateRequest(**update_data_dict)
+            pid = person_id if type(person_id) is int else int(person_id)
+            person_update_request = _UPDATE_ADAPTER.validate_json(person_update_data_json)
             
             updated_person_response_model = await crud.update_person(person_id=pid, person_update_data=person_update_request)
             
             if updated_person_response_model:
-                return json.dumps(updated_person_response_model.model_dump())
+                return updated_person_response_model.model_dump_json(exclude_none=True)
             else:
-                return json.dumps({"error": "Person not found or update failed.", "person_id": pid})
-        except json.JSONDecodeError as e:
-            return json.dumps({"error": "Invalid JSON input for update data.", "details": str(e)})
+                return _ERR_NOT_FOUND % pid
+        except ValidationError as e:
+            # Structured error list straight from pydantic-core, rather than the formatted str(e)
+            errors = e.errors(include_url=False, include_context=False)
+            if any(error["type"] == "json_invalid" for error in errors):
+                return _ERR_BAD_JSON % dumps(errors)
+            return _ERR_FAILED % dumps(errors)
         except ValueError:
-            return json.dumps({"error": "Invalid person_id format. Must be an integer.", "person_id_received": str(person_id)})
+            return _ERR_BAD_ID % dumps(str(person_id))
         except Exception as e:
-            return json.dumps({"error": "Failed to update person.", "details": str(e)})
+            return _ERR_FAILED % dumps(str(e))
@@ -1,19 +1,25 @@
 # app/plugins/people_crud_plugin.py
-from typing import Optional, Union # Added Union # Added
+from typing import Optional
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
-from semantic_kernel.functions.kernel_parameter_metadata import KernelParameterMetadata
 from .functions.create_person_function import CreatePersonFunction
 from .functions.get_person_function import GetPersonFunction
 from .functions.get_people_function import GetPeopleFunction
+from .functions.get_people_batch_function import GetPeopleBatchFunction
 from .functions.update_person_function import UpdatePersonFunction
 from .functions.delete_person_function import DeletePersonFunction
 
 class PeopleCRUDPlugin:
-    """Container for all people CRUD operations."""
+    """
+    Container for all people CRUD operations.
+
+    The kernel functions hand back the delegate's coroutine instead of awaiting it,
+    so each call runs in a single coroutine frame; the kernel awaits the result.
+    """
     def __init__(self):
         self.create_plugin = CreatePersonFunction()
         self.get_person_plugin = GetPersonFunction()
         self.get_people_plugin = GetPeopleFunction()
+        self.get_people_batch_plugin = GetPeopleBatchFunction()
         self.update_plugin = UpdatePersonFunction()
         self.delete_plugin = DeletePersonFunction()
         
@@ -26,9 +32,9 @@ class PeopleCRUDPlugin:
                     "'age' (integer, optional), and 'email' (string, optional, must be unique if provided).",
         name="create_person"
     )
-    async def create_person(self, person_data_json):
+    def create_person(self, person_data_json):
         """Creates a new person in the system."""
-        return await self.create_plugin.create_person_from_json_async(person_data_json)
+        return self.create_plugin.create_person_from_json_async(person_data_json)
     
     ## ====================================================
 
@@ -36,32 +42,46 @@ class PeopleCRUDPlugin:
         description="Retrieves a specific person by their unique ID.",
         name="get_person_by_id"
     )
-    async def get_person_by_id(self, person_id):
+    def get_person_by_id(self, person_id):
         """Retrieves a specific person by their unique ID."""
-        return await self.get_person_plugin.get_person_by_id_async(person_id)
+        return self.get_person_plugin.get_person_by_id_async(person_id)
+    
+    ## ====================================================
+
+    @kernel_function(
+        description="Retrieves several people by their unique IDs in one call. "
+                    "The input must be a JSON array of integer IDs. Prefer this over repeated get_person_by_id calls.",
+        name="get_people_batch"
+    )
+    def get_people_batch(self, person_ids_json):
+        """Retrieves several people by their unique IDs."""
+        return self.get_people_batch_plugin.get_people_batch_async(person_ids_json)
     
     ## ====================================================
     
     @kernel_function(
-        description="Retrieves a list of people. Supports pagination with 'skip' and 'limit'.",
+        description="Retrieves a page of people ordered by ID. Returns 'items' and a 'next_cursor'; "
+                    "pass 'cursor' from the previous page to get the next one. 'skip' is deprecated.",
         name="get_all_people"
         # 'parameters' argument removed as it's not supported by @kernel_function decorator
     )
-    async def get_all_people(
+    def get_all_people(
         self,
-        skip: Optional[int] = 0,  
-        limit: Optional[int] = 100 
-    ) -> Union[list, dict]:
-        """Retrieves a list of all people with pagination support.
+        cursor: Optional[int] = None,
+        limit: Optional[int] = 100,
+        skip: Optional[int] = 0
+    ) -> str:
+        """Retrieves a page of people with cursor pagination support.
 
         Args:
-            skip (Optional[int]): Number of records to skip for pagination. Defaults to 0.
+            cursor (Optional[int]): The 'next_cursor' from the previous page; omit for the first page.
             limit (Optional[int]): Maximum number of records to return. Defaults to 100.
+            skip (Optional[int]): Deprecated offset pagination, used only when no cursor is given. Defaults to 0.
         """
         # Handle cases where 'skip' or 'limit' might be explicitly passed as None by the client
         actual_skip = skip if skip is not None else 0 
         actual_limit = limit if limit is not None else 100
-        return await self.get_people_plugin.get_all_people_async(actual_skip, actual_limit)
+        return self.get_people_plugin.get_all_people_async(actual_skip, actual_limit, cursor)
     
     ## ====================================================
     
@@ -71,9 +91,9 @@ class PeopleCRUDPlugin:
                     "Fields can include 'first_name', 'last_name', 'age', 'email'. All fields are optional in the update data.",
         name="update_person_by_id"
     )
-    async def update_person_by_id(self, person_id, person_update_data_json):
+    def update_person_by_id(self, person_id, person_update_data_json):
         """Updates an existing person by their unique ID."""
-        return await self.update_plugin.update_person_by_id_async(person_id, person_update_data_json)
+        return self.update_plugin.update_person_by_id_async(person_id, person_update_data_json)
     
     ## ====================================================
     
@@ -81,6 +101,11 @@ class PeopleCRUDPlugin:
         description="Deletes a person by their unique ID.",
         name="delete_person_by_id"
     )
-    async def delete_person_by_id(self, person_id):
+    def delete_person_by_id(self, person_id):
         """Deletes a person by their unique ID."""
-        return await self.delete_plugin.delete_person_by_id_async(person_id)
+        return self.delete_plugin.delete_person_by_id_async(person_id)
+
+## ====================================================
+
+# The plugin and its function objects are stateless, so one process-wide instance serves every kernel
+people_crud_plugin = PeopleCRUDPlugin()
@@ -3,21 +3,8 @@ from semantic_kernel.functions.kernel_function_decorator import kernel_function
 
 ## ====================================================
 
-class SystemPromptPlugin:
-    """
-    Plugin to provide a system prompt to the LLM, guiding its use of available tools.
-    """
-
-    @kernel_function(
-        description="Provides a system prompt that informs the LLM about available tools and their usage.",
-        name="get_system_prompt"
-    )
-    def get_system_prompt(self) -> str:
-        """
-        Returns a system prompt string for the LLM.
-        This prompt should describe the available CRUD operations for people.
-        """
-        prompt = ('''
+# Built once at import; the text is the same on every chat turn
+_SYSTEM_PROMPT = ('''
         You are a helpful AI assistant that can manage a list of people. You have the following tools at your disposal:
 
         1.  **create_person**: 
@@ -32,18 +19,24 @@ class SystemPromptPlugin:
             *   Input: An integer 'person_id'.
             *   Example: `get_person_by_id(person_id=123)`
 
-        3.  **get_all_people**:
-            *   Description: Retrieves a list of all people. Supports pagination with 'skip' (integer, optional, default 0) and 'limit' (integer, optional, default 100).
-            *   Usage: Call this when asked to list people. You can ask the user if they want to specify skip/limit if many people exist.
-            *   Example: `get_all_people(skip=0, limit=10)` or `get_all_people()`
+        3.  **get_people_batch**:
+            *   Description: Retrieves several people by their unique IDs in a single call.
+            *   Usage: Call this instead of repeated get_person_by_id calls whenever you need more than one person. The result has 'people' and 'missing_ids' (IDs that were not found).
+            *   Input: A JSON string 'person_ids_json' holding an array of integer IDs.
+            *   Example: `get_people_batch(person_ids_json='[1, 2, 3]')`
 
-        4.  **update_person_by_id**:
+        4.  **get_all_people**:
+            *   Description: Retrieves a page of people ordered by ID. Supports pagination with 'cursor' (integer, optional) and 'limit' (integer, optional, default 100).
+            *   Usage: Call this when asked to list people. The result has 'items' and 'next_cursor'; to get the next page, call again with cursor set to 'next_cursor'. A null 'next_cursor' means there are no more people.
+            *   Example: `get_all_people(limit=10)` then `get_all_people(cursor=10, limit=10)`
+
+        5.  **update_person_by_id**:
             *   Description: Updates an existing person by their unique ID.
             *   Usage: Call this when asked to modify an existing person's details. Requires the person's ID and a JSON string of fields to update.
             *   Input: An integer 'person_id' and a JSON string 'person_update_data_json' with fields like 'first_name', 'last_name', 'age', 'email' (all optional in the JSON).
             *   Example: `update_person_by_id(person_id=123, person_update_data_json='{"age": 31, "email": "john.new.doe@example.com"}')`
 
-        5.  **delete_person_by_id**:
+        6.  **delete_person_by_id**:
             *   Description: Deletes a person by their unique ID.
             *   Usage: Call this when asked to remove a person. Confirm with the user before deleting if not explicitly told to proceed without confirmation.
             *   Input: An integer 'person_id'.
@@ -55,4 +48,21 @@ class SystemPromptPlugin:
         Always provide the parameters in the correct format as described (e.g., JSON strings where specified).
         If an operation is successful, summarize what was done. If an error occurs, inform the user about the error.
         ''')
-        return { "system_prompt": prompt }
+
+## ====================================================
+
+class SystemPromptPlugin:
+    """
+    Plugin to provide a system prompt to the LLM, guiding its use of available tools.
+    """
+
+    @kernel_function(
+        description="Provides a system prompt that informs the LLM about available tools and their usage.",
+        name="get_system_prompt"
+    )
+    def get_system_prompt(self) -> str:
+        """
+        Returns a system prompt string for the LLM.
+        This prompt should describe the available CRUD operations for people.
+        """
+        return { "system_prompt": _SYSTEM_PROMPT }
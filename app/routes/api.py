@@ -1,12 +1,33 @@
 # app/routes/api.py
-from typing import List
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 from .. import crud, models
 
 ## ====================================================
 
+# Upper bound on page size so a single request can't pull the whole table into a worker
+MAX_PAGE_SIZE = 1000
+
+# Serializer for list responses, built once. The endpoints below return pre-encoded JSON and are
+# annotated "-> Response" rather than given a response_model (or a model return annotation, which
+# FastAPI would also treat as one), so FastAPI doesn't re-validate and re-encode every item;
+# the OpenAPI schema comes from each route's responses={...}
+_PEOPLE_ADAPTER = TypeAdapter(List[models.PersonResponse])
+_PEOPLE_PAGE = b'{"items":%b,"next_cursor":%b}'
+
+## ====================================================
+
+def _json_response(content: bytes, status_code: int = status.HTTP_200_OK) -> Response:
+    """Wraps already-serialized JSON bytes in a Response."""
+    return Response(content=content, status_code=status_code, media_type="application/json")
+
+## ====================================================
+
 router = APIRouter(
     prefix="/people",
     tags=["People"],
@@ -15,8 +36,8 @@ router = APIRouter(
 
 ## ====================================================
 
-@router.post("/", response_model=models.PersonResponse, status_code=status.HTTP_201_CREATED, summary="Create a new person")
-async def create_person_endpoint(person_data: models.PersonCreateRequest):
+@router.post("/", status_code=status.HTTP_201_CREATED, responses={201: {"model": models.PersonResponse}}, summary="Create a new person")
+async def create_person_endpoint(person_data: models.PersonCreateRequest) -> Response:
     """
     Creates a new person in the system.
 
@@ -32,26 +53,73 @@ async def create_person_endpoint(person_data: models.PersonCreateRequest):
     # This kind of check might also live in the CRUD layer or be a database constraint.
     # For now, assuming basic validation here and relying on DB for uniqueness if set.
 
-    return await crud.create_person(person_data=person_data)
+    person_response = await crud.create_person(person_data=person_data)
+    return _json_response(person_response.model_dump_json(), status_code=status.HTTP_201_CREATED)
+
+## ====================================================
+
+@router.post("/bulk", status_code=status.HTTP_201_CREATED, responses={201: {"model": List[models.PersonResponse]}}, summary="Create many people at once")
+async def create_people_bulk_endpoint(people_data: List[models.PersonCreateRequest]) -> Response:
+    """
+    Creates several people in one request, using a single database transaction.
+
+    - **people_data**: A list of people to create (from API request models).
+    - **Raises HTTPException (422)**: If any provided email format is invalid.
+    - **Returns**: The newly created person objects, in request order.
+    """
+    if any(person.email and "@" not in person.email for person in people_data):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid email format")
+
+    people_responses = await crud.create_people_bulk(people_data=people_data)
+    return _json_response(_PEOPLE_ADAPTER.dump_json(people_responses), status_code=status.HTTP_201_CREATED)
+
+## ====================================================
+
+@router.get("/", responses={200: {"model": Union[models.PeoplePage, List[models.PersonResponse]]}}, summary="Get all people")
+async def read_people_endpoint(
+    cursor: Optional[int] = Query(None, ge=0),
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    skip: int = Query(0, ge=0, deprecated=True),
+) -> Response:
+    """
+    Retrieves a list of people ordered by ID, with optional pagination.
+
+    - **cursor**: ID after which to start; pass the previous page's `next_cursor`. Use `cursor=0` for the first page.
+    - **limit**: Maximum number of records to return.
+    - **skip**: Deprecated offset pagination, used only when no cursor is given.
+    - **Returns**: With a cursor, a page of `items` plus `next_cursor` (null on the last page);
+      otherwise a plain list of person API response models.
+    """
+    if cursor is None:
+        people_responses = await crud.get_people(skip=skip, limit=limit)
+        return _json_response(_PEOPLE_ADAPTER.dump_json(people_responses))
+
+    people_responses = await crud.get_people(limit=limit, after_id=cursor)
+    # A short page means there is nothing after it
+    next_cursor = people_responses[-1].id if len(people_responses) == limit else None
+    return _json_response(_PEOPLE_PAGE % (_PEOPLE_ADAPTER.dump_json(people_responses), orjson.dumps(next_cursor)))
 
 ## ====================================================
 
-@router.get("/", response_model=List[models.PersonResponse], summary="Get all people")
-async def read_people_endpoint(skip: int = 0, limit: int = 100):
+@router.get("/stream", summary="Stream people as newline-delimited JSON")
+async def stream_people_endpoint(skip: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE)) -> StreamingResponse:
     """
-    Retrieves a list of people, with optional pagination.
+    Streams a page of people as newline-delimited JSON, one person per line.
 
     - **skip**: Number of records to skip for pagination.
     - **limit**: Maximum number of records to return.
-    - **Returns**: A list of person API response models.
+    - **Returns**: An `application/x-ndjson` stream of person API response models.
     """
-    people_responses = await crud.get_people(skip=skip, limit=limit)
-    return people_responses
+    async def _people_lines():
+        async for person in crud.iter_people(skip=skip, limit=limit):
+            yield person.model_dump_json() + "\n"
+
+    return StreamingResponse(_people_lines(), media_type="application/x-ndjson")
 
 ## ====================================================
 
-@router.get("/{person_id}", response_model=models.PersonResponse, summary="Get a specific person by ID")
-async def read_person_endpoint(person_id: int):
+@router.get("/{person_id}", responses={200: {"model": models.PersonResponse}}, summary="Get a specific person by ID")
+async def read_person_endpoint(person_id: int) -> Response:
     """
     Retrieves a specific person by their ID.
 
@@ -62,12 +130,12 @@ async def read_person_endpoint(person_id: int):
     person_response = await crud.get_person(person_id=person_id)
     if person_response is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
-    return person_response
+    return _json_response(person_response.model_dump_json())
 
 ## ====================================================
 
-@router.put("/{person_id}", response_model=models.PersonResponse, summary="Update an existing person")
-async def update_person_endpoint(person_id: int, person_update_input: models.PersonUpdateRequest):
+@router.put("/{person_id}", responses={200: {"model": models.PersonResponse}}, summary="Update an existing person")
+async def update_person_endpoint(person_id: int, person_update_input: models.PersonUpdateRequest) -> Response:
     """
     Updates an existing person by their ID.
 
@@ -83,7 +151,7 @@ async def update_person_endpoint(person_id: int, person_update_input: models.Per
     if updated_person_response is None:
         # This implies the person was not found by the crud layer, or an issue occurred during update.
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found or update failed")
-    return updated_person_response
+    return _json_response(updated_person_response.model_dump_json())
 
 ## ====================================================
 
@@ -1,17 +1,26 @@
-# app/routes/mcp.py
-import os
-import json
-from fastapi import APIRouter, status, HTTPException
+# app/routes/chat.py
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from typing import AsyncIterator, Optional, Tuple
 
-from openai import OpenAI
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, status, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from openai.types.chat import ChatCompletionMessageToolCall
 
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
-from ..llm import kernel
-from ..models import ChatRequest
+from ..llm import OPENAI_MODEL, create_chat_completion, get_kernel, get_people_crud_tools, get_tool_function_index, stream_chat_completion
+from ..models import BatchChatRequest, ChatRequest
 
 ## ====================================================
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/chat",
     tags=["Chat"],
@@ -20,189 +29,425 @@ router = APIRouter(
 
 ## ====================================================
 
-@router.post("/chat", summary="Chat with LLM using Semantic Kernel and tools")
-async def chat(request: ChatRequest):
+# Exact-match cache of answers to first-turn queries, keyed by a digest of the query text.
+# Only answers that needed no tool calls are stored: tool results read or change live data.
+_RESPONSE_CACHE = TTLCache(maxsize=1024, ttl=600)
+
+def _response_cache_key(user_query: str) -> bytes:
+    """Returns a fixed-size cache key for a query, so long queries don't bloat the cache."""
+    return hashlib.blake2b(user_query.encode(), digest_size=16).digest()
+
+## ====================================================
+
+_DEFAULT_SYSTEM_MESSAGE = "You are a helpful assistant with access to tools. Analyze the user's question and use the appropriate tools when needed to get information."
+
+# The system prompt is static, so the plugin result is reused for a while rather than invoked per turn.
+# A failed lookup caches the default briefly so a broken plugin isn't retried on every request.
+_SYSTEM_MESSAGE_TTL = 60.0  # seconds
+_SYSTEM_MESSAGE_ERROR_TTL = 5.0  # seconds
+_system_message_cache: Optional[tuple] = None  # (message, is_fallback, expires_at on the monotonic clock)
+_system_message_lock = asyncio.Lock()
+
+async def _invoke_system_prompt(kernel) -> tuple:
+    """
+    Gets the system message from the SystemPrompt plugin if available, else a generic default.
+    Returns it with whether it is the fallback for a failed lookup, and its TTL.
+    """
     try:
-        # 1. Get system message from the SystemPrompt plugin if available
+        if "SystemPrompt" in kernel.plugins and "get_system_prompt" in kernel.plugins["SystemPrompt"]:
+            system_prompt_function = kernel.plugins["SystemPrompt"]["get_system_prompt"]
+            system_prompt_result = await kernel.invoke(system_prompt_function)
+            # Check if the result has a value attribute
+            if hasattr(system_prompt_result, 'value'):
+                # Check if the value is a dict with 'system_prompt' key
+                if isinstance(system_prompt_result.value, dict) and 'system_prompt' in system_prompt_result.value:
+                    system_message = system_prompt_result.value['system_prompt']
+                else:
+                    system_message = str(system_prompt_result.value)
+            else:
+                system_message = str(system_prompt_result)
+        else:
+            system_message = _DEFAULT_SYSTEM_MESSAGE
+    except Exception as e:
+        logger.warning("Error getting system prompt: %s", e)
+        return _DEFAULT_SYSTEM_MESSAGE, True, _SYSTEM_MESSAGE_ERROR_TTL
+    return system_message, False, _SYSTEM_MESSAGE_TTL
+
+async def _get_system_message(kernel) -> Tuple[str, bool]:
+    """
+    Returns the system message and whether it is the fallback for a failed lookup,
+    refreshing it from the SystemPrompt plugin once the cached one expires.
+    """
+    global _system_message_cache
+    cached = _system_message_cache
+    if cached is not None and cached[2] > time.monotonic():
+        return cached[0], cached[1]
+
+    # Concurrent requests that find the cache expired wait for a single refresh
+    async with _system_message_lock:
+        cached = _system_message_cache
+        if cached is None or cached[2] <= time.monotonic():
+            system_message, is_fallback, ttl = await _invoke_system_prompt(kernel)
+            cached = _system_message_cache = (system_message, is_fallback, time.monotonic() + ttl)
+    return cached[0], cached[1]
+
+## ====================================================
+
+# Limits on the tool calls of one model reply, so a runaway reply can't swamp the process or hang the turn
+_MAX_CONCURRENT_TOOL_CALLS = 8
+_TOOL_CALL_TIMEOUT = 15  # seconds
+
+@functools.lru_cache(maxsize=1024)
+def _parse_tool_arguments(arguments: str) -> dict:
+    """
+    Parses a tool call's JSON arguments, reusing the result when the model repeats the same arguments.
+    The returned dict is shared between callers and must be treated as read-only.
+    """
+    return orjson.loads(arguments)
+
+@functools.cache
+def _argument_coercer(plugin_name: str, func_name: str):
+    """
+    Returns the argument coercer for one kernel function, built on first use from its parameter list.
+    Nulls become "" and everything else a string; arguments the function doesn't declare are dropped.
+    """
+    param_names = tuple(param.name for param in get_kernel().plugins[plugin_name][func_name].parameters)
+
+    def _coerce(function_args: dict) -> dict:
+        return {
+            name: "" if function_args[name] is None else str(function_args[name])
+            for name in param_names if name in function_args
+        }
+
+    return _coerce
+
+async def _run_tool_call(kernel, tool_call) -> dict:
+    """Executes one tool call requested by the model and returns its tool-result message."""
+    function_name = tool_call.function.name
+    function_args = _parse_tool_arguments(tool_call.function.arguments)
+
+    # Resolve the tool name the model used to the plugin function it was built from
+    entry = get_tool_function_index().get(function_name)
+
+    logger.debug("Tool call: %s with args: %s", function_name, function_args)
+
+    # Execute the function using the kernel
+    if entry is not None:
+        plugin_name, func_name, kernel_function = entry
+
+        # Process arguments to ensure correct types
+        processed_args = _argument_coercer(plugin_name, func_name)(function_args)
+
+        # Convert processed arguments to KernelArguments; update() skips the two dict copies **-unpacking makes
+        kernel_args = KernelArguments()
+        kernel_args.update(processed_args)
+
+        # Call the function
         try:
-            if "SystemPrompt" in kernel.plugins and "get_system_prompt" in kernel.plugins["SystemPrompt"]:
-                system_prompt_function = kernel.plugins["SystemPrompt"]["get_system_prompt"]
-                system_prompt_result = await kernel.invoke(system_prompt_function)
-                # Check if the result has a value attribute
-                if hasattr(system_prompt_result, 'value'):
-                    # Check if the value is a dict with 'system_prompt' key
-                    if isinstance(system_prompt_result.value, dict) and 'system_prompt' in system_prompt_result.value:
-                        system_message = system_prompt_result.value['system_prompt']
-                    else:
-                        system_message = str(system_prompt_result.value)
+            result = await asyncio.wait_for(kernel.invoke(kernel_function, arguments=kernel_args), timeout=_TOOL_CALL_TIMEOUT)
+            if hasattr(result, 'value'):
+                if result.value is None:
+                    tool_result = "Operation completed successfully."
                 else:
-                    system_message = str(system_prompt_result)
+                    tool_result = str(result.value)
             else:
-                system_message = "You are a helpful assistant with access to tools. Analyze the user's question and use the appropriate tools when needed to get information."
+                tool_result = str(result)
+        except asyncio.TimeoutError:
+            logger.warning("Timed out executing %s.%s after %ss", plugin_name, func_name, _TOOL_CALL_TIMEOUT)
+            tool_result = f"Error executing function: timed out after {_TOOL_CALL_TIMEOUT} seconds"
         except Exception as e:
-            print(f"Error getting system prompt: {e}")
-            system_message = "You are a helpful assistant with access to tools. Analyze the user's question and use the appropriate tools when needed to get information."
+            logger.exception("Error executing %s.%s", plugin_name, func_name)
+            tool_result = f"Error executing function: {str(e)}"
+    else:
+        tool_result = f"Function {function_name} not found"
 
-        # 2. Prepare the conversation history as a simple formatted string
-        conversation = f"System: {system_message}\n\n"
-        
-        # Add previous messages from request if any
-        for msg in request.chat_history:
-            if msg.get("role") == "user":
-                conversation += f"User: {msg.get('content', '')}\n"
-            elif msg.get("role") == "assistant":
-                conversation += f"Assistant: {msg.get('content', '')}\n"
-
-        # Add the current user query
-        conversation += f"User: {request.user_query}\n"
-        conversation += "Assistant: "
-        
-        # Check if PeopleCRUD plugin is available
-        tools = []
-        plugin = kernel.plugins["PeopleCRUD"]
-        
-        # Convert plugin functions to OpenAI tool format
-        for func_name, func_metadata in plugin.functions.items():
-            # Extract parameters for the function
-            parameters = {
-                "type": "object",
-                "properties": {}
-            }
-            
-            # Handle parameters properly
-            for param in func_metadata.parameters:
-                # Set default type to string if not specified
-                param_type = "string"
-                
-                # Add the parameter with proper type and description
-                parameters["properties"][param.name] = {
-                    "type": param_type,
-                    "description": param.description or f"Parameter {param.name}"
-                }
-            
-            # Create the tool definition with proper schema
-            tools.append({
-                "type": "function",
-                "function": {
-                    "name": f"{plugin.name}_{func_name}",
-                    "description": func_metadata.description or f"Function to {func_name}",
-                    "parameters": parameters
-                }
-            })
-        
-        # Make the API call with tools configuration
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        openai_response = client.chat.completions.create(
-            model=os.getenv("OPENAI_API_MODEL", "gpt-4o-mini"),
-            messages=[
-                {"role": "system", "content": system_message},
-                *[{"role": msg.get("role"), "content": msg.get("content", "")} for msg in request.chat_history],
-                {"role": "user", "content": request.user_query}
-            ],
-            tools=tools,
-            tool_choice="auto"
+    return {
+        "tool_call_id": tool_call.id,
+        "role": "tool",
+        "name": function_name,
+        "content": tool_result
+    }
+
+def _assistant_tool_call_message(content: Optional[str], tool_calls) -> dict:
+    """
+    Builds the assistant message that echoes the model's tool calls back in the follow-up request.
+    Only the fields the API reads are copied, rather than model_dump()-ing the whole response message.
+    """
+    return {
+        "role": "assistant",
+        "content": content,
+        "tool_calls": [
+            {"id": tool_call.id, "type": "function", "function": {"name": tool_call.function.name, "arguments": tool_call.function.arguments}}
+            for tool_call in tool_calls
+        ]
+    }
+
+async def _run_tool_calls(kernel, tool_calls) -> list:
+    """Executes the tool calls of one model reply, at most _MAX_CONCURRENT_TOOL_CALLS at a time; results keep call order."""
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOL_CALLS)
+
+    async def _bounded(tool_call) -> dict:
+        async with semaphore:
+            return await _run_tool_call(kernel, tool_call)
+
+    results = await asyncio.gather(*(_bounded(tool_call) for tool_call in tool_calls), return_exceptions=True)
+
+    # A call that failed before reaching the kernel (e.g. malformed arguments) still gets a result message
+    return [
+        result if not isinstance(result, BaseException) else {
+            "tool_call_id": tool_call.id,
+            "role": "tool",
+            "name": tool_call.function.name,
+            "content": f"Error executing function: {str(result)}"
+        }
+        for tool_call, result in zip(tool_calls, results)
+    ]
+
+## ====================================================
+
+def _cached_reply(request: ChatRequest) -> Optional[dict]:
+    """Returns the cached reply for a first-turn query, or None on a miss or a follow-up turn."""
+    # Follow-up turns depend on the history, so only first-turn queries use the response cache
+    if request.chat_history:
+        return None
+    cached_content = _RESPONSE_CACHE.get(_response_cache_key(request.user_query))
+    if cached_content is None:
+        return None
+    return {
+        "llm_response": cached_content.strip(),
+        "chat_history": [
+            {"role": "user", "content": request.user_query},
+            {"role": "assistant", "content": cached_content}
+        ]
+    }
+
+## ====================================================
+
+def _turn_messages(request: ChatRequest, system_message: str) -> list:
+    """Builds the system, history and user messages for one chat turn."""
+    return [
+        {"role": "system", "content": system_message},
+        *[{"role": msg.role, "content": msg.content} for msg in request.chat_history],
+        {"role": "user", "content": request.user_query}
+    ]
+
+def _turn_history(turn_messages: list, assistant_content: str) -> list:
+    """
+    Returns the chat history to send back after a turn: the turn's messages without the system
+    message, plus the assistant's reply. The history dicts built for the model call are reused as-is.
+    """
+    return [*turn_messages[1:], {"role": "assistant", "content": assistant_content}]
+
+## ====================================================
+
+async def _chat_turn(request: ChatRequest, kernel, system_message: str, tools: list, cache_reply: bool = True) -> dict:
+    """
+    Runs one chat turn against the model, executing any tool calls it asks for, and returns the reply.
+    With cache_reply=False (e.g. under the fallback system message) the reply is never stored in the response cache.
+    """
+    # Messages for this turn, built once and reused as the prefix of the follow-up tool-result call
+    turn_messages = _turn_messages(request, system_message)
+
+    # Make the API call with tools configuration, on the shared async client so the event loop isn't blocked
+    openai_response = await create_chat_completion(
+        model=OPENAI_MODEL,
+        messages=turn_messages,
+        tools=tools,
+        tool_choice="auto"
+    )
+
+    # Handle the response, potentially including tool calls
+    assistant_message = openai_response.choices[0].message
+
+    # Check if the model wants to call a tool
+    if hasattr(assistant_message, 'tool_calls') and assistant_message.tool_calls:
+        # The model wants to use a tool
+        # Run the requested tool calls concurrently (bounded); results come back in call order
+        tool_results = await _run_tool_calls(kernel, assistant_message.tool_calls)
+
+        # Create messages for further processing with the tool results
+        tool_messages = [
+            *turn_messages,
+            _assistant_tool_call_message(assistant_message.content, assistant_message.tool_calls),  # Include the assistant's tool call message
+            *[{"role": "tool", "tool_call_id": result["tool_call_id"], "name": result["name"], "content": result["content"]} for result in tool_results]
+        ]
+
+        # Send the tool results back to the model for a final response
+        final_response = await create_chat_completion(
+            model=OPENAI_MODEL,
+            messages=tool_messages
         )
+
+        # Get the final response after tool usage
+        llm_response_content = final_response.choices[0].message.content or ""
+
+        # Create complete chat history including tool usage
+        tool_usage_summary = "\n\n[Used tools: " + ", ".join([result["name"] for result in tool_results]) + "]"
+        current_turn_history = _turn_history(turn_messages, llm_response_content + tool_usage_summary)
+    else:
+        # No tool calls, just get the text response
+        llm_response_content = assistant_message.content or ""
+        if cache_reply and not request.chat_history:
+            _RESPONSE_CACHE[_response_cache_key(request.user_query)] = llm_response_content
+
+        # Create response history for continuity
+        current_turn_history = _turn_history(turn_messages, llm_response_content)
+
+    return {"llm_response": llm_response_content.strip(), "chat_history": current_turn_history}
+
+## ====================================================
+
+def _sse(payload: dict) -> bytes:
+    """Encodes one server-sent event."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+_SSE_DONE = b"data: [DONE]\n\n"
+
+# Stop caches and reverse proxies (e.g. nginx) from holding events back, so each delta reaches the client at once
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+## ====================================================
+
+async def _stream_chat_turn(request: ChatRequest, kernel, system_message: str, tools: list) -> AsyncIterator[bytes]:
+    """
+    Runs one chat turn like _chat_turn, but streams the model's text as server-sent events as it arrives.
+    Tool-call fragments are accumulated until the first stream ends; the tools are then run and the
+    follow-up answer is streamed too. The last event carries the full reply and updated chat history.
+    """
+    turn_messages = _turn_messages(request, system_message)
+    content_parts = []
+    tool_call_parts = {}  # index -> {"id", "name", "arguments"}, filled from streamed fragments
+    # Each stream holds an OpenAI concurrency slot until it is read to the end (or the client goes away)
+    async with stream_chat_completion(
+        model=OPENAI_MODEL,
+        messages=turn_messages,
+        tools=tools,
+        tool_choice="auto"
+    ) as stream:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                content_parts.append(delta.content)
+                yield _sse({"delta": delta.content})
+            for tool_call_delta in delta.tool_calls or ():
+                parts = tool_call_parts.setdefault(tool_call_delta.index, {"id": "", "name": "", "arguments": ""})
+                if tool_call_delta.id:
+                    parts["id"] = tool_call_delta.id
+                if tool_call_delta.function:
+                    parts["name"] += tool_call_delta.function.name or ""
+                    parts["arguments"] += tool_call_delta.function.arguments or ""
+
+    llm_response_content = "".join(content_parts)
+    if tool_call_parts:
+        tool_calls = [
+            ChatCompletionMessageToolCall(id=parts["id"], type="function", function={"name": parts["name"], "arguments": parts["arguments"]})
+            for _, parts in sorted(tool_call_parts.items())
+        ]
+        tool_results = await _run_tool_calls(kernel, tool_calls)
+
+        tool_messages = [
+            *turn_messages,
+            _assistant_tool_call_message(llm_response_content or None, tool_calls),
+            *[{"role": "tool", "tool_call_id": result["tool_call_id"], "name": result["name"], "content": result["content"]} for result in tool_results]
+        ]
+        content_parts = []
+        async with stream_chat_completion(model=OPENAI_MODEL, messages=tool_messages) as final_stream:
+            async for chunk in final_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    content_parts.append(chunk.choices[0].delta.content)
+                    yield _sse({"delta": chunk.choices[0].delta.content})
+        llm_response_content = "".join(content_parts)
+        assistant_content = llm_response_content + "\n\n[Used tools: " + ", ".join([result["name"] for result in tool_results]) + "]"
+    else:
+        assistant_content = llm_response_content
+
+    yield _sse({
+        "llm_response": llm_response_content.strip(),
+        "chat_history": _turn_history(turn_messages, assistant_content)
+    })
+
+## ====================================================
+
+@router.post("/chat", response_class=ORJSONResponse, summary="Chat with LLM using Semantic Kernel and tools")
+async def chat(request: ChatRequest):
+    try:
+        cached_reply = _cached_reply(request)
+        if cached_reply is not None:
+            return ORJSONResponse(cached_reply)
+
+        # Built on first use, so a failure to create the client or load the plugins is handled below
+        kernel = get_kernel()
+
+        # 1. Get system message from the SystemPrompt plugin if available
+        system_message, is_fallback = await _get_system_message(kernel)
+
+        # The tool schema is built once per process, at startup
+        tools = get_people_crud_tools()
         
-        # Handle the response, potentially including tool calls
-        assistant_message = openai_response.choices[0].message
-        
-        # Check if the model wants to call a tool
-        if hasattr(assistant_message, 'tool_calls') and assistant_message.tool_calls:
-            # The model wants to use a tool
-            tool_results = []
-            
-            # Process each tool call
-            for tool_call in assistant_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-                
-                # Extract plugin_name and actual function name
-                if "_" in function_name:
-                    plugin_name, func_name = function_name.split("_", 1)
-                else:
-                    # Handle case where naming is different
-                    plugin_name = "PeopleCRUD"  # Default plugin
-                    func_name = function_name
-                
-                print(f"Tool call: {plugin_name}.{func_name} with args: {function_args}")
-                
-                # Execute the function using the kernel
-                if plugin_name in kernel.plugins and func_name in kernel.plugins[plugin_name]:
-                    # Get the function from the plugin
-                    kernel_function = kernel.plugins[plugin_name][func_name]
-                    
-                    # Process arguments to ensure correct types
-                    processed_args = {}
-                    for param_name, param_value in function_args.items():
-                        # For now, we'll just ensure strings are strings and handle nulls
-                        if param_value is None:
-                            processed_args[param_name] = ""
-                        else:
-                            processed_args[param_name] = str(param_value)
-                    
-                    # Convert processed arguments to KernelArguments
-                    kernel_args = KernelArguments(**processed_args)
-                    
-                    # Call the function
-                    try:
-                        result = await kernel.invoke(kernel_function, arguments=kernel_args)
-                        if hasattr(result, 'value'):
-                            if result.value is None:
-                                tool_result = "Operation completed successfully."
-                            else:
-                                tool_result = str(result.value)
-                        else:
-                            tool_result = str(result)
-                    except Exception as e:
-                        print(f"Error executing {plugin_name}.{func_name}: {str(e)}")
-                        tool_result = f"Error executing function: {str(e)}"
-                else:
-                    tool_result = f"Function {plugin_name}.{func_name} not found"
-                
-                tool_results.append({
-                    "tool_call_id": tool_call.id,
-                    "role": "tool",
-                    "name": function_name,
-                    "content": tool_result
-                })
-            
-            # Create messages for further processing with the tool results
-            tool_messages = [
-                {"role": "system", "content": system_message},
-                *[{"role": msg.get("role"), "content": msg.get("content", "")} for msg in request.chat_history],
-                {"role": "user", "content": request.user_query},
-                assistant_message.model_dump(),  # Include the assistant's tool call message
-                *[{"role": "tool", "tool_call_id": result["tool_call_id"], "name": result["name"], "content": result["content"]} for result in tool_results]
-            ]
-            
-            # Send the tool results back to the model for a final response
-            final_response = client.chat.completions.create(
-                model=os.getenv("OPENAI_API_MODEL", "gpt-4o-mini"),
-                messages=tool_messages
-            )
-            
-            # Get the final response after tool usage
-            llm_response_content = final_response.choices[0].message.content or ""
-            
-            # Create complete chat history including tool usage
-            tool_usage_summary = "\n\n[Used tools: " + ", ".join([result["name"] for result in tool_results]) + "]"
-            current_turn_history = request.chat_history + [
-                {"role": "user", "content": request.user_query},
-                {"role": "assistant", "content": llm_response_content + tool_usage_summary}
-            ]
-        else:
-            # No tool calls, just get the text response
-            llm_response_content = assistant_message.content or ""
-            
-            # Create response history for continuity
-            current_turn_history = request.chat_history + [
-                {"role": "user", "content": request.user_query},
-                {"role": "assistant", "content": llm_response_content}
-            ]
-        
-        # We've already set llm_response_content and current_turn_history above
-        return {"llm_response": llm_response_content.strip(), "chat_history": current_turn_history}
+        # Returned as a response directly so FastAPI doesn't run jsonable_encoder over the history first.
+        # Answers given under the fallback prompt aren't cached, so they don't outlive the plugin's recovery.
+        return ORJSONResponse(await _chat_turn(request, kernel, system_message, tools, cache_reply=not is_fallback))
+
+    except Exception as e:
+        logger.exception("Error in /chat/chat")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An error occurred: {str(e)}")
+
+## ====================================================
+
+@router.post("/batch", response_class=ORJSONResponse, summary="Chat with LLM for several independent queries at once")
+async def chat_batch(payload: BatchChatRequest):
+    """
+    Answers several independent chat requests concurrently, sharing one system-message fetch and tool schema.
+    Replies come back in request order; a request that fails gets an {"error": ...} entry instead of failing the batch.
+    """
+    try:
+        kernel = get_kernel()
+        system_message, is_fallback = await _get_system_message(kernel)
+        tools = get_people_crud_tools()
+    except Exception as e:
+        # Without the kernel or tools no request in the batch can be answered
+        logger.exception("Error in /chat/batch")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An error occurred: {str(e)}")
 
+    async def _reply(request: ChatRequest) -> dict:
+        try:
+            return _cached_reply(request) or await _chat_turn(request, kernel, system_message, tools, cache_reply=not is_fallback)
+        except Exception as e:
+            logger.exception("Error in /chat/batch")
+            return {"error": f"An error occurred: {str(e)}"}
+
+    responses = await asyncio.gather(*(_reply(request) for request in payload.requests))
+    return ORJSONResponse({"responses": responses})
+
+## ====================================================
+
+@router.post("/stream", summary="Chat with LLM, streaming the reply as server-sent events")
+async def chat_stream(request: ChatRequest):
+    """
+    Same as /chat/chat, but the reply is streamed as `text/event-stream`.
+    Each `{"delta": ...}` event carries the next piece of text; the last JSON event carries
+    `llm_response` and `chat_history`, or `error` if the turn failed part-way. The stream then
+    ends with a `[DONE]` event.
+    """
+    try:
+        kernel = get_kernel()
+        system_message, _ = await _get_system_message(kernel)
+        tools = get_people_crud_tools()
     except Exception as e:
-        print(f"Error in /mcp/chat: {type(e).__name__} - {str(e)}")
+        # Nothing has been sent yet, so a setup failure can still be a regular error response
+        logger.exception("Error in /chat/stream")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"An error occurred: {str(e)}")
+
+    async def _events() -> AsyncIterator[bytes]:
+        try:
+            async for event in _stream_chat_turn(request, kernel, system_message, tools):
+                yield event
+        except Exception as e:
+            # Headers are already sent, so the failure is reported in-band
+            logger.exception("Error in /chat/stream")
+            yield _sse({"error": f"An error occurred: {str(e)}"})
+        yield _SSE_DONE
+
+    return StreamingResponse(_events(), media_type="text/event-stream", headers=_SSE_HEADERS)
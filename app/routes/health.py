@@ -1,5 +1,5 @@
 # app/routes/health.py
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
 ## ====================================================
 
@@ -9,13 +9,42 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# The health payload never changes, so it's encoded once
+HEALTH_PATH = "/api/health"
+_HEALTH_BODY = b'{"status":"API endpoint is healthy"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+## ====================================================
+
+class HealthCheckMiddleware:
+    """
+    Pure ASGI middleware answering GET /api/health before routing, so frequent load-balancer
+    probes skip router dispatch, the other middleware and response encoding.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == HEALTH_PATH and scope["method"] in ("GET", "HEAD"):
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
+
 ## ====================================================
 
-@router.get("/health", response_model=dict, status_code=status.HTTP_200_OK, summary="Health endpoint")
-async def api_health():
+# Normally answered by HealthCheckMiddleware; the route keeps the endpoint in the OpenAPI docs
+# and serves it if the middleware isn't installed.
+@router.get("/health", status_code=status.HTTP_200_OK, summary="Health endpoint",
+            responses={200: {"content": {"application/json": {"example": {"status": "API endpoint is healthy"}}}}})
+async def api_health() -> Response:
     """
     Retrieves a simple health check response for the API.
 
     - **Returns**: A JSON object with a status message indicating the API is healthy.
     """
-    return {"status": "API endpoint is healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -1,15 +1,20 @@
 # app/routes/mcp.py
-from typing import Dict, Optional
-from fastapi import APIRouter, status, HTTPException, Response
-from pydantic import BaseModel, Field
+import functools
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from fastapi import APIRouter, status, Response
 
 from semantic_kernel.functions.kernel_arguments import KernelArguments
 
-from ..llm import kernel
-from ..models import ExecuteToolRequest, MCPInitializeRequest, MCPToolCallRequest, MCPToolsListRequest
+from ..llm import get_kernel
+from ..models import MCPFunction, MCPInitializeRequest, MCPParameter, MCPPlugin, MCPToolCallRequest, MCPToolsListRequest
 
 ## ====================================================
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/mcp",
     tags=["MCP"],
@@ -18,6 +23,62 @@ router = APIRouter(
 
 ## ====================================================
 
+@functools.cache
+def _function_index() -> Tuple[Dict[str, Tuple[str, Any]], List[str]]:
+    """
+    Returns the tools/call lookup table, built on first use: function name -> (plugin name, kernel function),
+    with the first plugin winning on a name clash as in a plugin-by-plugin scan, plus every function name
+    in registration order for the not-found error. Plugins are only registered when the kernel is built.
+    """
+    index = {}
+    available_functions = []
+    for plugin_name, plugin in get_kernel().plugins.items():
+        for func_name, kernel_function in plugin.functions.items():
+            index.setdefault(func_name, (plugin_name, kernel_function))
+            available_functions.append(func_name)
+    return index, available_functions
+
+## ====================================================
+
+@functools.cache
+def _availability_json() -> bytes:
+    """
+    Returns the serialized /mcp/ availability payload, built on first use.
+    Plugins are only registered when the kernel is built, so the payload never changes afterwards.
+    """
+    plugins_details = [
+        MCPPlugin(
+            name=plugin_name,
+            description=plugin.description or "",
+            functions=[
+                MCPFunction(
+                    name=func_name,
+                    description=func_metadata.description or f"Function to {func_name}",
+                    parameters=[
+                        MCPParameter(
+                            name=param.name,
+                            description=param.description or f"Parameter {param.name}",
+                            required=bool(param.is_required)
+                        )
+                        for param in func_metadata.parameters
+                    ]
+                )
+                for func_name, func_metadata in plugin.functions.items()
+            ]
+        ).model_dump()
+        for plugin_name, plugin in get_kernel().plugins.items()
+    ]
+    return orjson.dumps({"status": "MCP is available", "plugins": plugins_details})
+
+@router.get("/", summary="Check MCP availability and list the loaded plugins")
+async def mcp_availability():
+    """
+    Reports that MCP is available, with every loaded plugin and its functions.
+    """
+    return Response(content=_availability_json(), media_type="application/json")
+
+## ====================================================
+
 @router.post("/initialize", summary="Initialize the MCP API connection")
 async def initialize(request: MCPInitializeRequest):
     """
@@ -30,7 +91,7 @@ async def initialize(request: MCPInitializeRequest):
 
     protocolVersion = "2024-11-05"
     
-    print(f"[MCP] MCP initialized with: {client_name} {client_version}, protocol version {protocolVersion}")
+    logger.info("MCP initialized with: %s %s, protocol version %s", client_name, client_version, protocolVersion)
     
     return {
         "jsonrpc": "2.0",
@@ -49,17 +110,20 @@ async def initialize(request: MCPInitializeRequest):
 
 ## ====================================================
 
+# Notifications get no body, so one empty 204 response is shared; Starlette doesn't change it when sending
+_NO_CONTENT = Response(status_code=204)
+
 @router.post("/notifications/initialized", summary="Handle initialized notification")
 async def notifications_initialized():
     """Handle the initialized notification - no response needed for notifications"""
-    return Response(status_code=204)  # No Content
+    return _NO_CONTENT
 
 ## ====================================================
 
 @router.post("/notifications/cancelled", summary="Handle cancelled notification") 
 async def notifications_cancelled():
     """Handle cancelled notifications - no response needed for notifications"""
-    return Response(status_code=204)  # No Content
+    return _NO_CONTENT
 
 ## ====================================================
 
@@ -81,83 +145,63 @@ async def resources_list(request: Optional[dict] = None):
 
 ## ====================================================
 
+@functools.cache
+def _tools_list_json() -> bytes:
+    """
+    Returns the serialized MCP tool list for every loaded plugin, built on first use.
+    Plugins are only registered when the kernel is built, so the list never changes afterwards.
+    """
+    tools_list = []
+
+    for plugin_name, plugin in get_kernel().plugins.items():
+        for func_name, func_metadata in plugin.functions.items():
+            # Convert parameters to MCP inputSchema format
+            properties = {}
+            required_params = []
+            
+            for param in func_metadata.parameters:
+                properties[param.name] = {
+                    "type": "string",  # Could enhance to detect actual types
+                    "description": param.description or f"Parameter {param.name}"
+                }
+                if getattr(param, 'required', False):
+                    required_params.append(param.name)
+            
+            # Add the tool in MCP format
+            tools_list.append({
+                "name": func_name,
+                "description": func_metadata.description or f"Function to {func_name}",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": properties,
+                    **({"required": required_params} if required_params else {})
+                }
+            })
+
+    return orjson.dumps(tools_list)
+
+# Response envelopes; only the request ID is encoded per call
+_TOOLS_LIST_RPC = b'{"jsonrpc":"2.0","id":%b,"result":{"tools":%b}}'
+_TOOLS_LIST_GET = b'{"tools":%b}'
+
+## ====================================================
+
 @router.post("/tools/list", summary="List available MCP tools")
 async def list_tools_post(request: MCPToolsListRequest):
     """Handle POST requests to tools/list with JSON-RPC format"""
-    tools_list = []
-
-    if kernel.plugins:
-        for plugin_name, plugin in kernel.plugins.items():
-            for func_name, func_metadata in plugin.functions.items():
-                # Convert parameters to MCP inputSchema format
-                properties = {}
-                required_params = []
-                
-                for param in func_metadata.parameters:
-                    properties[param.name] = {
-                        "type": "string",  # Could enhance to detect actual types
-                        "description": param.description or f"Parameter {param.name}"
-                    }
-                    if getattr(param, 'required', False):
-                        required_params.append(param.name)
-                
-                # Add the tool in MCP format
-                tools_list.append({
-                    "name": func_name,
-                    "description": func_metadata.description or f"Function to {func_name}",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": properties,
-                        **({"required": required_params} if required_params else {})
-                    }
-                })
-    
     # Return in proper MCP JSON-RPC format
-    return {
-        "jsonrpc": "2.0",
-        "id": request.id,
-        "result": {
-            "tools": tools_list
-        }
-    }
+    return Response(
+        content=_TOOLS_LIST_RPC % (orjson.dumps(request.id), _tools_list_json()),
+        media_type="application/json"
+    )
 
 ## ====================================================
 
 @router.get("/tools/list", summary="List available MCP tools (GET)")
 async def list_tools_get():
     """Handle GET requests to tools/list for backwards compatibility"""
-    tools_list = []
-
-    if kernel.plugins:
-        for plugin_name, plugin in kernel.plugins.items():
-            for func_name, func_metadata in plugin.functions.items():
-                # Convert parameters to MCP inputSchema format
-                properties = {}
-                required_params = []
-                
-                for param in func_metadata.parameters:
-                    properties[param.name] = {
-                        "type": "string",
-                        "description": param.description or f"Parameter {param.name}"
-                    }
-                    if getattr(param, 'required', False):
-                        required_params.append(param.name)
-                
-                # Add the tool in MCP format
-                tools_list.append({
-                    "name": func_name,
-                    "description": func_metadata.description or f"Function to {func_name}",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": properties,
-                        **({"required": required_params} if required_params else {})
-                    }
-                })
-    
     # Return just the tools array for GET requests
-    return {
-        "tools": tools_list
-    }
+    return Response(content=_TOOLS_LIST_GET % _tools_list_json(), media_type="application/json")
 
 ## ====================================================
 
@@ -177,7 +221,9 @@ async def call_tool(request: MCPToolCallRequest):
                     "message": f"Invalid method: {request.method}, expected 'tools/call'"
                 }
             }
-            
+        
+        # Built on first use, so a failure to create the client or load the plugins lands in the except below
+        kernel = get_kernel()
         if not kernel.plugins:
             return {
                 "jsonrpc": "2.0",
@@ -193,25 +239,14 @@ async def call_tool(request: MCPToolCallRequest):
         arguments = request.params.arguments or {}
         request_id = request.id or 1
         
-        print(f"[MCP] Calling function: {function_name} with arguments: {arguments}")
+        logger.debug("Calling function: %s with arguments: %s", function_name, arguments)
         
         # Find the plugin containing this function
-        plugin_name = None
-        kernel_function = None
-        
-        for p_name, plugin in kernel.plugins.items():
-            if function_name in plugin:
-                plugin_name = p_name
-                kernel_function = plugin[function_name]
-                break
+        function_index, available_functions = _function_index()
+        plugin_name, kernel_function = function_index.get(function_name, (None, None))
         
         # Validate function exists
         if not kernel_function:
-            available_functions = []
-            for p_name, plugin in kernel.plugins.items():
-                for f_name in plugin.functions.keys():
-                    available_functions.append(f_name)
-            
             return {
                 "jsonrpc": "2.0",
                 "id": request_id,
@@ -221,20 +256,20 @@ async def call_tool(request: MCPToolCallRequest):
                 }
             }
         
-        print(f"[MCP] Found function '{function_name}' in plugin '{plugin_name}'")
+        logger.debug("Found function '%s' in plugin '%s'", function_name, plugin_name)
         
-        # Prepare arguments for the kernel function
-        kernel_args = KernelArguments(**arguments)
+        # Prepare arguments for the kernel function; update() skips the two dict copies **-unpacking makes
+        kernel_args = KernelArguments()
+        kernel_args.update(arguments)
         
         # Invoke the kernel function
         result = await kernel.invoke(kernel_function, arguments=kernel_args)
         
-        # Process the result value
+        # MCP text content is always a string; plugin functions already return JSON strings
         response_value = result.value
-        if not isinstance(response_value, (str, int, float, bool, dict, list, type(None))):
-            response_value = str(response_value)
+        response_text = response_value if type(response_value) is str else str(response_value)
         
-        print(f"[MCP] Function result: {response_value}")
+        logger.debug("Function result: %s", response_text)
         
         # Return in proper MCP format with content array
         return {
@@ -244,14 +279,14 @@ async def call_tool(request: MCPToolCallRequest):
                 "content": [
                     {
                         "type": "text", 
-                        "text": str(response_value) if not isinstance(response_value, str) else response_value
+                        "text": response_text
                     }
                 ]
             }
         }
         
     except Exception as e:
-        print(f"[MCP] Error in /mcp/tools/call: {type(e).__name__} - {str(e)}")
+        logger.exception("Error in /mcp/tools/call")
         return {
             "jsonrpc": "2.0",
             "id": getattr(request, 'id', 1),
@@ -6,27 +6,63 @@ Main application file for the People API.
 from dotenv import load_dotenv
 load_dotenv()
 
+import logging
+import logging.handlers
+import os
+import queue
+
 from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
-from app import database
+from app import database, llm
 from app.routes import api, health, mcp, chat
 
 ## ====================================================
 
+# Logging: handlers on the request path only enqueue records; a background thread does the actual writes
+# (records are formatted before they're queued, so the stream handler writes them as-is)
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+
+## ====================================================
+
 # FastAPI app instance
 app = FastAPI(
     title="People API - MCP Support",
     description="A simple API to manage a list of people, now refactored into modules. With MCP Support",
     version="1.0.0",
+    # Route return values are serialized with orjson rather than the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 ## ====================================================
 
+# Compress larger responses (e.g. long chat histories); SSE streams are left uncompressed by the middleware
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Added last so it's outermost: health probes are answered before any other middleware runs
+app.add_middleware(health.HealthCheckMiddleware)
+
+## ====================================================
+
+# Log listener event handlers
+app.add_event_handler("startup", _log_listener.start)
+app.add_event_handler("shutdown", _log_listener.stop)
+
 # Database event handlers
 app.add_event_handler("startup", database.connect_db)
 app.add_event_handler("shutdown", database.disconnect_db)
 
+# LLM client event handlers
+app.add_event_handler("startup", llm.warm_up_llm)
+app.add_event_handler("shutdown", llm.close_llm_client)
+
 ## ====================================================
 
 # Include the routers
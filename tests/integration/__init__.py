@@ -0,0 +1 @@
+# This file makes the 'tests/integration' directory a Python package
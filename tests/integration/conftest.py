@@ -0,0 +1,162 @@
+import asyncio
+import pytest
+import pytest_asyncio
+import os
+import tempfile
+from typing import AsyncGenerator, Callable, Coroutine, Any, Dict, List
+
+import databases
+from sqlalchemy import insert
+
+from app import database as db_module
+from app import models
+from app import crud
+from app import entities
+
+## ====================================================
+
+# Private (non-shared-cache) database file for the session, on tmpfs where available so it stays in RAM.
+# Each pytest-xdist worker (gw0, gw1, ...) gets its own file, so workers never contend for a lock.
+_TEST_DB_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else tempfile.gettempdir()
+_TEST_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_PATH = os.path.join(_TEST_DB_DIR, f"pytest_people_{_TEST_WORKER_ID}_{os.getpid()}.db")
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DATABASE_PATH}"
+
+# Test-only PRAGMAs for the single test connection, on top of the app's per-connection ones.
+# journal_mode=WAL is set with the schema instead, as it can't change inside the force_rollback transaction.
+TEST_SQLITE_PRAGMAS = (
+    "temp_store=MEMORY",
+    "locking_mode=EXCLUSIVE",
+    "cache_size=-20000",
+)
+
+def _remove_test_database_files() -> None:
+    for path in (TEST_DATABASE_PATH, f"{TEST_DATABASE_PATH}-wal", f"{TEST_DATABASE_PATH}-shm", f"{TEST_DATABASE_PATH}-journal"):
+        if os.path.exists(path):
+            os.remove(path)
+
+def _create_test_schema(test_engine) -> None:
+    """Creates the tables in a fresh test database file, switching it to WAL (which persists in the file)."""
+    with test_engine.begin() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+        db_module.metadata.create_all(bind=connection)
+    test_engine.dispose()
+
+@pytest_asyncio.fixture(scope="session")
+async def test_database() -> AsyncGenerator[databases.Database, None]:
+    """
+    Set up the SQLite test database once per session.
+    The schema is created once; the database object runs every query on a single connection inside
+    an outer transaction (force_rollback), so each test can be rolled back to a SAVEPOINT.
+    """
+    # monkeypatch is function-scoped, so the session gets its own; undo() restores DATABASE_URL
+    session_monkeypatch = pytest.MonkeyPatch()
+    session_monkeypatch.setenv("DATABASE_URL", TEST_DATABASE_URL)  # Override for tests, use the session's private DB file
+    
+    # Built from the URL rather than by reloading app.database, so crud's precompiled statements and
+    # the schema below all use the same metadata and Table objects.
+    # force_rollback keeps a single connection for every query, so there's no pool to size.
+    test_db, test_engine = db_module.make_database(TEST_DATABASE_URL, force_rollback=True)
+    
+    # Create the schema once, before the test connection opens its outer transaction
+    _remove_test_database_files()
+    await asyncio.to_thread(_create_test_schema, test_engine)
+    
+    await test_db.connect()
+    for pragma in TEST_SQLITE_PRAGMAS:
+        await test_db.execute(f"PRAGMA {pragma}")
+    
+    yield test_db
+    
+    await test_db.disconnect()
+    _remove_test_database_files()
+    session_monkeypatch.undo()
+
+## ====================================================
+
+@pytest_asyncio.fixture(scope="function")
+async def test_db_session(test_database: databases.Database, monkeypatch) -> AsyncGenerator[None, None]:
+    """
+    Run a test against the session test database inside a SAVEPOINT that is rolled back afterwards,
+    so every test starts from the same empty tables without deleting anything.
+    """
+    # Point the app at the session database
+    monkeypatch.setattr(db_module, "database", test_database)
+    crud._PERSON_CACHE.clear()  # Rolled-back IDs get reused, so cached rows must not outlive the test
+    
+    savepoint = await test_database.transaction().start()
+    
+    yield # Test runs here
+    
+    await savepoint.rollback()
+    crud._PERSON_CACHE.clear()
+
+## ====================================================
+
+@pytest_asyncio.fixture(scope="function")
+async def create_person_in_db(test_db_session: None) -> Callable[..., Coroutine[Any, Any, int]]:
+    """
+    Provides a callable to create a person directly in the DB for test setup.
+    Relies on test_db_session to ensure DB is ready.
+    Returns the ID of the created person.
+    """
+    async def _create_person(first_name: str, last_name: str, age: int = 30, email: str = None) -> int:
+        if email is None:
+            # Create a unique email if not provided to avoid IntegrityErrors
+            email = f"{first_name.lower()}.{last_name.lower()}@example-test.com"
+        
+        person_data = models.PersonCreateRequest(
+            first_name=first_name, 
+            last_name=last_name, 
+            age=age, 
+            email=email
+        )
+        created_person = await crud.create_person(person_data=person_data)
+        return created_person.id
+    
+    return _create_person
+
+## ====================================================
+
+async def _insert_people(db: databases.Database, rows: List[Dict[str, Any]]) -> List[int]:
+    """Inserts the rows with one multi-row INSERT ... RETURNING and returns the created IDs in row order."""
+    values = [
+        {
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "age": row.get("age", 30),
+            # Create a unique email if not provided to avoid IntegrityErrors
+            "email": row.get("email") or f"{row['first_name'].lower()}.{row['last_name'].lower()}@example-test.com",
+        }
+        for row in rows
+    ]
+    query = insert(entities.people).values(values).returning(entities.people.c.id)
+    created_rows = await db.fetch_all(query)
+    return [created_row["id"] for created_row in created_rows]
+
+@pytest_asyncio.fixture(scope="function")
+async def create_people_in_db(test_db_session: None) -> Callable[..., Coroutine[Any, Any, List[int]]]:
+    """
+    Provides a callable to seed several people directly in the DB with one multi-row INSERT.
+    Each row is a dict with 'first_name' and 'last_name', and optionally 'age' and 'email'
+    (defaulting as in create_person_in_db). Returns the created IDs in row order.
+    """
+    async def _create_people(rows: List[Dict[str, Any]]) -> List[int]:
+        return await _insert_people(db_module.database, rows)
+    
+    return _create_people
+
+## ====================================================
+
+@pytest_asyncio.fixture(scope="class")
+async def seeded_people(request, test_database: databases.Database) -> AsyncGenerator[List[int], None]:
+    """
+    Seed the rows in the requesting test class's SEED_ROWS once for all of its tests (read-only ones,
+    e.g. parametrized queries), inside a SAVEPOINT that is rolled back after the class.
+    Each test's own test_db_session SAVEPOINT nests inside it. Yields the created IDs in row order.
+    """
+    savepoint = await test_database.transaction().start()
+    
+    yield await _insert_people(test_database, request.cls.SEED_ROWS)
+    
+    await savepoint.rollback()
@@ -1,4 +1,4 @@
-# tests/test_crud.py
+# tests/integration/test_crud.py
 import pytest
 from typing import List
 
@@ -9,9 +9,15 @@ from app import entities # For direct DB interaction if needed, or type hints
 # The test_db_session fixture from conftest.py needs to be explicitly requested
 # by each test function that needs database access.
 
+# Seed rows for the listing tests, inserted in one statement by create_people_in_db
+_THREE_PEOPLE = [
+    {"first_name": "Person", "last_name": "One", "age": 21},
+    {"first_name": "Person", "last_name": "Two", "age": 22},
+    {"first_name": "Person", "last_name": "Three", "age": 23},
+]
+
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_create_person(test_db_session):
     """Test creating a person successfully."""
     person_create_data = models.PersonCreateRequest(
@@ -37,7 +43,26 @@ async def test_create_person(test_db_session):
 
 ## ====================================================
 
-@pytest.mark.asyncio
+async def test_create_people_bulk(test_db_session):
+    """Test creating several people in one bulk insert."""
+    people_create_data = [
+        models.PersonCreateRequest(first_name="Bulk", last_name=f"Person{i}", age=i % 100, email=f"bulk{i}@example.com")
+        for i in range(300) # More than one insert chunk
+    ]
+    created_people = await crud.create_people_bulk(people_data=people_create_data)
+
+    assert len(created_people) == len(people_create_data)
+    assert all(isinstance(person, models.PersonResponse) for person in created_people)
+    assert [person.last_name for person in created_people] == [p.last_name for p in people_create_data]
+    assert len({person.id for person in created_people}) == len(people_create_data)
+
+    # Verify they're in the database
+    retrieved_person = await crud.get_person(person_id=created_people[-1].id)
+    assert retrieved_person is not None
+    assert retrieved_person.email == "bulk299@example.com"
+
+## ====================================================
+
 async def test_get_person_exists(test_db_session, create_person_in_db):
     """Test getting an existing person."""
     person_id = await create_person_in_db(first_name="Existing", last_name="Person", age=40)
@@ -49,7 +74,6 @@ async def test_get_person_exists(test_db_session, create_person_in_db):
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_get_person_not_exists(test_db_session):
     """Test getting a non-existent person."""
     retrieved_person = await crud.get_person(person_id=99999)
@@ -57,7 +81,22 @@ async def test_get_person_not_exists(test_db_session):
 
 ## ====================================================
 
-@pytest.mark.asyncio
+async def test_get_person_cache_invalidated_on_write(test_db_session, create_person_in_db):
+    """Test that a cached person is not served after it is updated or deleted."""
+    person_id = await create_person_in_db(first_name="Cached", last_name="Person", age=33)
+
+    first_read = await crud.get_person(person_id=person_id) # Populates the cache
+    assert first_read.first_name == "Cached"
+
+    await crud.update_person(person_id=person_id, person_update_data=models.PersonUpdateRequest(first_name="Fresh"))
+    updated_read = await crud.get_person(person_id=person_id)
+    assert updated_read.first_name == "Fresh"
+
+    await crud.delete_person(person_id=person_id)
+    assert await crud.get_person(person_id=person_id) is None
+
+## ====================================================
+
 async def test_get_people_empty(test_db_session):
     """Test getting people when the database is empty."""
     people_list = await crud.get_people(skip=0, limit=10)
@@ -66,35 +105,72 @@ async def test_get_people_empty(test_db_session):
 
 ## ====================================================
 
-@pytest.mark.asyncio
-async def test_get_people_with_data(test_db_session, create_person_in_db):
-    """Test getting people with pagination and data."""
-    await create_person_in_db(first_name="Person", last_name="One", age=21)
-    await create_person_in_db(first_name="Person", last_name="Two", age=22)
-    await create_person_in_db(first_name="Person", last_name="Three", age=23)
+class TestGetPeopleWithData:
+    """get_people pagination cases sharing one seed of three people (see the seeded_people fixture)."""
+    SEED_ROWS = _THREE_PEOPLE
+
+    @pytest.mark.parametrize("skip,limit,expected_last_names", [
+        (0, 10, ["One", "Two", "Three"]), # Get all
+        (1, 1, ["Two"]), # Skip 1, limit 1
+        (0, 5, ["One", "Two", "Three"]), # Limit more than available
+        (3, 10, []), # Skip all
+    ])
+    async def test_get_people_with_data(self, seeded_people, test_db_session, skip, limit, expected_last_names):
+        """Test getting people with pagination and data."""
+        people = await crud.get_people(skip=skip, limit=limit)
+        assert [person.last_name for person in people] == expected_last_names
+
+## ====================================================
+
+async def test_get_people_after_id(test_db_session, create_people_in_db):
+    """Test keyset pagination with after_id."""
+    first_id, second_id, _ = await create_people_in_db(_THREE_PEOPLE)
+
+    next_page = await crud.get_people(limit=1, after_id=first_id)
+    assert len(next_page) == 1
+    assert next_page[0].id == second_id
+
+    rest = await crud.get_people(limit=10, after_id=second_id)
+    assert [person.last_name for person in rest] == ["Three"]
+
+    # skip is ignored when after_id is given
+    assert await crud.get_people(skip=5, limit=10, after_id=0) == await crud.get_people(limit=10)
+
+## ====================================================
+
+async def test_get_people_by_ids(test_db_session, create_people_in_db):
+    """Test fetching several people by ID in one call."""
+    first_id, second_id = await create_people_in_db(_THREE_PEOPLE[:2])
 
-    # Get all
-    all_people = await crud.get_people(skip=0, limit=10)
-    assert len(all_people) == 3
-    assert all_people[0].last_name == "One"
-    assert all_people[2].last_name == "Three"
+    people_by_id = await crud.get_people_by_ids([second_id, first_id, second_id, 99999])
+    assert set(people_by_id) == {first_id, second_id}
+    assert people_by_id[second_id].last_name == "Two"
 
-    # Test pagination: skip 1, limit 1
-    paginated_people = await crud.get_people(skip=1, limit=1)
-    assert len(paginated_people) == 1
-    assert paginated_people[0].last_name == "Two"
+    assert await crud.get_people_by_ids([]) == {}
+
+## ====================================================
+
+async def test_get_people_by_ids_many(test_db_session, create_people_in_db):
+    """Test that an ID list longer than one IN (...) chunk still finds every person."""
+    first_id, second_id, third_id = await create_people_in_db(_THREE_PEOPLE)
+
+    # The seeded IDs land in different chunks, between thousands of missing ones
+    person_ids = [first_id, *range(100000, 102500), second_id, *range(200000, 202500), third_id]
+    people_by_id = await crud.get_people_by_ids(person_ids)
+    assert set(people_by_id) == {first_id, second_id, third_id}
+
+## ====================================================
 
-    # Test pagination: limit more than available
-    limited_people = await crud.get_people(skip=0, limit=5)
-    assert len(limited_people) == 3
+async def test_iter_people(test_db_session, create_people_in_db):
+    """Test streaming people one at a time with pagination."""
+    await create_people_in_db(_THREE_PEOPLE)
 
-    # Test pagination: skip all
-    skipped_all = await crud.get_people(skip=3, limit=10)
-    assert len(skipped_all) == 0
+    streamed_people = [person async for person in crud.iter_people(skip=1, limit=5)]
+    assert all(isinstance(person, models.PersonResponse) for person in streamed_people)
+    assert [person.last_name for person in streamed_people] == ["Two", "Three"]
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_update_person_exists(test_db_session, create_person_in_db):
     """Test updating an existing person."""
     person_id = await create_person_in_db(first_name="Original", last_name="Name", age=50)
@@ -120,7 +196,6 @@ async def test_update_person_exists(test_db_session, create_person_in_db):
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_update_person_partial_update(test_db_session, create_person_in_db):
     """Test partially updating an existing person (only one field)."""
     person_id = await create_person_in_db(first_name="OriginalFN", last_name="OriginalLN", age=60, email="original@example.com")
@@ -136,7 +211,6 @@ async def test_update_person_partial_update(test_db_session, create_person_in_db
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_update_person_no_actual_change(test_db_session, create_person_in_db):
     """Test updating with an empty update request (no fields to change)."""
     person_id = await create_person_in_db(first_name="NoChange", last_name="Person", age=70)
@@ -150,7 +224,6 @@ async def test_update_person_no_actual_change(test_db_session, create_person_in_
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_update_person_not_exists(test_db_session):
     """Test updating a non-existent person."""
     update_data = models.PersonUpdateRequest(first_name="Ghost")
@@ -159,7 +232,6 @@ async def test_update_person_not_exists(test_db_session):
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_delete_person_exists(test_db_session, create_person_in_db):
     """Test deleting an existing person."""
     person_id = await create_person_in_db(first_name="ToDelete", last_name="User")
@@ -173,7 +245,6 @@ async def test_delete_person_exists(test_db_session, create_person_in_db):
 
 ## ====================================================
 
-@pytest.mark.asyncio
 async def test_delete_person_not_exists(test_db_session):
     """Test deleting a non-existent person."""
     delete_result = await crud.delete_person(person_id=99999)
@@ -0,0 +1,128 @@
+# tests/integration/test_database.py
+import pytest_asyncio # Moved import to top
+from unittest import mock
+from app import database as db_module
+
+# asyncio_mode = auto (pytest.ini) runs the async tests here without an asyncio marker
+
+## ====================================================
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def manage_db_state_after_tests():
+    """
+    Ensures that if a test leaves the global database object connected,
+    it gets disconnected.
+    """
+    yield
+    if db_module.database.is_connected:
+        await db_module.database.disconnect()
+
+## ====================================================
+def test_database_url_default(monkeypatch):
+    """Test that DATABASE_URL defaults correctly when the env var is not set."""
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    database_url = db_module.database_url_from_env()
+
+    assert database_url == "sqlite+aiosqlite:///./people.db"
+    assert db_module.sync_database_url_for(database_url) == "sqlite:///./people.db"
+
+## ====================================================
+
+def test_database_url_from_env_aiosqlite(monkeypatch):
+    """Test DATABASE_URL and sync_database_url with an aiosqlite URL from env var."""
+    test_url = "sqlite+aiosqlite:///./people.db"
+    monkeypatch.setenv("DATABASE_URL", test_url)
+    database_url = db_module.database_url_from_env()
+
+    assert database_url == test_url
+    assert db_module.sync_database_url_for(database_url) == "sqlite:///./people.db"
+
+## ====================================================
+
+async def test_connect_disconnect_flow():
+    """Test the basic database connect and disconnect flow."""
+    # Use a separate in-memory database to avoid conflicts
+    # This ensures we're testing the basic flow without other test interference
+    test_db, test_engine = db_module.make_database("sqlite+aiosqlite:///:memory:")
+
+    assert not test_db.is_connected, "Database should initially be disconnected"
+
+    # Instead of mocking metadata.create_all, we'll check if tables exist after connection
+    await db_module.connect_db(test_db, test_engine)
+    assert test_db.is_connected, "Database should be connected after connect_db()"
+
+    # Clean up
+    await db_module.disconnect_db(test_db)
+    test_engine.dispose()
+
+## ====================================================
+
+async def test_connect_db_already_connected():
+    """Test behavior of connect_db when the database is already connected."""
+    # Use a separate in-memory database
+    test_db, test_engine = db_module.make_database("sqlite+aiosqlite:///:memory:")
+
+    # Use a spy instead of a mock to allow the real method to run
+    with mock.patch.object(db_module.metadata, 'create_all', wraps=db_module.metadata.create_all) as spy_create_all:
+        await db_module.connect_db(test_db, test_engine)  # First connection
+        assert test_db.is_connected
+        assert spy_create_all.call_count >= 1
+
+        # Call connect_db again
+        await db_module.connect_db(test_db, test_engine)
+        assert test_db.is_connected, "Database should remain connected"
+        # create_all should be called again
+        assert spy_create_all.call_count >= 2, "create_all should be called again"
+
+    # Clean up
+    await db_module.disconnect_db(test_db)
+    test_engine.dispose()
+
+## ====================================================
+
+async def test_disconnect_db_not_connected():
+    """Test behavior of disconnect_db when the database is not connected."""
+    # Use a separate in-memory database
+    test_db, test_engine = db_module.make_database("sqlite+aiosqlite:///:memory:")
+
+    assert not test_db.is_connected
+    # Attempting to disconnect when not connected should be safe and not raise an error
+    await db_module.disconnect_db(test_db)
+    assert not test_db.is_connected, "Database should remain disconnected"
+    test_engine.dispose()
+
+## ====================================================
+
+async def test_sqlite_connection_pragmas_apply_to_every_connection(tmp_path):
+    """Test that the per-connection PRAGMAs hold on the connections databases opens for later queries."""
+    db_file = tmp_path / "people_pragmas.db"
+    test_db, test_engine = db_module.make_database(f"sqlite+aiosqlite:///{db_file}")
+    await db_module.connect_db(test_db, test_engine)
+
+    assert await test_db.fetch_val("PRAGMA journal_mode") == "wal"
+    assert await test_db.fetch_val("PRAGMA synchronous") == 1 # NORMAL
+    assert await test_db.fetch_val("PRAGMA foreign_keys") == 1
+    assert await test_db.fetch_val("PRAGMA cache_size") == -65536
+
+    # Clean up
+    await db_module.disconnect_db(test_db)
+    test_engine.dispose()
+
+## ====================================================
+
+async def test_connect_db_skips_create_all_when_schema_exists(tmp_path):
+    """Test that connect_db only runs create_all when tables are missing from the SQLite file."""
+    db_file = tmp_path / "people_test.db"
+    test_db, test_engine = db_module.make_database(f"sqlite+aiosqlite:///{db_file}")
+
+    with mock.patch.object(db_module.metadata, 'create_all', wraps=db_module.metadata.create_all) as spy_create_all:
+        await db_module.connect_db(test_db, test_engine)  # Cold start: schema is created
+        assert spy_create_all.call_count == 1
+        await db_module.disconnect_db(test_db)
+
+        await db_module.connect_db(test_db, test_engine)  # Warm start: schema already exists
+        assert spy_create_all.call_count == 1, "create_all should be skipped when tables exist"
+
+    # Clean up
+    await db_module.disconnect_db(test_db)
+    test_engine.dispose()
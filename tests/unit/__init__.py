@@ -0,0 +1 @@
+# This file makes the 'tests/unit' directory a Python package
@@ -0,0 +1,62 @@
+# tests/unit/test_llm.py
+import asyncio
+import contextlib
+import types
+
+from app import llm
+
+## ====================================================
+
+class FakeStream:
+    """Stands in for the SDK's AsyncStream: yields nothing until closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+    async def close(self):
+        self.closed = True
+
+def _fake_openai_client(opened_streams: list):
+    async def create(**kwargs):
+        stream = FakeStream()
+        opened_streams.append(stream)
+        return stream
+    return types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+
+## ====================================================
+
+async def test_stream_chat_completion_holds_slot_until_stream_closes(monkeypatch):
+    """Test that N open streams use up N concurrency slots, so the (N+1)th waits for one to close."""
+    max_concurrency = 2
+    opened_streams = []
+    monkeypatch.setattr(llm, "_OPENAI_CONCURRENCY", asyncio.Semaphore(max_concurrency))
+    monkeypatch.setattr(llm, "get_openai_client", lambda: _fake_openai_client(opened_streams))
+
+    async with contextlib.AsyncExitStack() as open_streams:
+        first_stream = await open_streams.enter_async_context(llm.stream_chat_completion(model="test", messages=[]))
+        for _ in range(max_concurrency - 1):
+            await open_streams.enter_async_context(llm.stream_chat_completion(model="test", messages=[]))
+
+        async def _open_one_more():
+            async with llm.stream_chat_completion(model="test", messages=[]):
+                pass
+
+        # Every slot is held by an open stream, so the next one can't even be requested yet
+        waiting_stream = asyncio.create_task(_open_one_more())
+        await asyncio.sleep(0.05)
+        assert not waiting_stream.done()
+        assert len(opened_streams) == max_concurrency
+
+        # Closing one stream frees its slot for the waiting request
+        await open_streams.aclose()
+        await asyncio.wait_for(waiting_stream, timeout=1)
+
+    assert first_stream.closed
+    assert len(opened_streams) == max_concurrency + 1
+    assert llm._OPENAI_CONCURRENCY._value == max_concurrency
@@ -1,4 +1,4 @@
-# tests/test_mappers.py
+# tests/unit/test_mappers.py
 import pytest
 from typing import Optional
 
@@ -8,14 +8,47 @@ from app import mappers
 
 ## ====================================================
 
+# Inputs are built once per module with model_construct: these tests exercise the mappers, not
+# pydantic validation. model_construct still records which fields were set, as exclude_unset needs.
+_CREATE_REQUEST = models.PersonCreateRequest.model_construct(
+    first_name="Test",
+    last_name="User",
+    age=30,
+    email="test.user@example.com"
+)
+_PERSON_ENTITY = entities.PersonEntity.model_construct(
+    id=10,
+    first_name="Alice",
+    last_name="Wonderland",
+    age=25,
+    email="alice.wonder@example.com"
+)
+_UPDATE_REQUEST_ALL_FIELDS = models.PersonUpdateRequest.model_construct(
+    first_name="UpdatedFirst",
+    last_name="UpdatedLast",
+    age=40,
+    email="updated.email@example.com"
+)
+_UPDATE_REQUEST_SOME_NONE = models.PersonUpdateRequest.model_construct(
+    first_name="UpdatedFirstOnly",
+    last_name=None, # This field should be excluded
+    age=45,
+    email=None # This field should be excluded
+)
+_UPDATE_REQUEST_ALL_NONE = models.PersonUpdateRequest.model_construct(
+    first_name=None,
+    last_name=None,
+    age=None,
+    email=None
+)
+# Pydantic models created with no arguments will have fields set to their defaults (often None for Optional fields)
+_UPDATE_REQUEST_EMPTY = models.PersonUpdateRequest.model_construct()
+
+## ====================================================
+
 def test_to_person_entity_from_create():
     """Test mapping PersonCreateRequest to PersonEntity."""
-    request_model = models.PersonCreateRequest(
-        first_name="Test",
-        last_name="User",
-        age=30,
-        email="test.user@example.com"
-    )
+    request_model = _CREATE_REQUEST
     generated_id = 123
 
     entity = mappers.to_person_entity_from_create(request_model, generated_id)
@@ -73,13 +106,7 @@ def test_to_person_entity_from_dict_with_optional_nulls():
 
 def test_to_person_response_from_entity():
     """Test mapping PersonEntity to PersonResponse."""
-    person_entity = entities.PersonEntity(
-        id=10,
-        first_name="Alice",
-        last_name="Wonderland",
-        age=25,
-        email="alice.wonder@example.com"
-    )
+    person_entity = _PERSON_ENTITY
 
     response_model = mappers.to_person_response_from_entity(person_entity)
 
@@ -94,12 +121,7 @@ def test_to_person_response_from_entity():
 
 def test_to_update_dict_from_request_all_fields():
     """Test mapping PersonUpdateRequest to a dictionary for DB update (all fields)."""
-    update_request = models.PersonUpdateRequest(
-        first_name="UpdatedFirst",
-        last_name="UpdatedLast",
-        age=40,
-        email="updated.email@example.com"
-    )
+    update_request = _UPDATE_REQUEST_ALL_FIELDS
 
     update_dict = mappers.to_update_dict_from_request(update_request)
 
@@ -115,12 +137,7 @@ def test_to_update_dict_from_request_all_fields():
 
 def test_to_update_dict_from_request_some_fields_none():
     """Test mapping PersonUpdateRequest with some None fields."""
-    update_request = models.PersonUpdateRequest(
-        first_name="UpdatedFirstOnly",
-        last_name=None, # This field should be excluded
-        age=45,
-        email=None # This field should be excluded
-    )
+    update_request = _UPDATE_REQUEST_SOME_NONE
 
     update_dict = mappers.to_update_dict_from_request(update_request)
 
@@ -134,12 +151,7 @@ def test_to_update_dict_from_request_some_fields_none():
 
 def test_to_update_dict_from_request_all_fields_none():
     """Test mapping PersonUpdateRequest with all fields None (empty update)."""
-    update_request = models.PersonUpdateRequest(
-        first_name=None,
-        last_name=None,
-        age=None,
-        email=None
-    )
+    update_request = _UPDATE_REQUEST_ALL_NONE
 
     update_dict = mappers.to_update_dict_from_request(update_request)
 
@@ -150,8 +162,7 @@ def test_to_update_dict_from_request_all_fields_none():
 
 def test_to_update_dict_from_request_no_fields_provided():
     """Test mapping an empty PersonUpdateRequest (no fields explicitly provided)."""
-    # Pydantic models created with no arguments will have fields set to their defaults (often None for Optional fields)
-    update_request = models.PersonUpdateRequest()
+    update_request = _UPDATE_REQUEST_EMPTY
 
     update_dict = mappers.to_update_dict_from_request(update_request)
     